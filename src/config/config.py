@@ -41,6 +41,7 @@ class GitHubConfig(BaseModel):
     token: str = Field(..., description="GitHub personal access token or app token")
     repo: str = Field(..., description="Repository in format owner/repo")
     api_url: str = Field(default="https://api.github.com", description="GitHub API base URL")
+    use_graphql: bool = Field(default=False, description="Fetch PR details through the GraphQL API in batches")
 
     @field_validator('repo')
     @classmethod
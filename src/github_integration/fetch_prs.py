@@ -4,19 +4,135 @@ Supports GitHub.com, GitHub Enterprise, and various authentication methods.
 Can use Git tags (v1.2.3) or commit SHAs (abc123f) as references.
 """
 
+import atexit
+import functools
+import json
+import logging
+import os
 import re
+import threading
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import FrozenSet, List, Optional, Dict, Any
 from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
 
 import requests
 from github import Github, GithubException
+from github.NamedUser import NamedUser
 from github.PullRequest import PullRequest
+from github.Repository import Repository
 
 from src.config.config import GitHubConfig
 from src.utils.logging import get_logger, log_api_call, log_workflow_step
 
 
+# Keep-alive connections PyGithub's requests session may hold to the API host
+_POOL_SIZE = 20
+
+# PRs fetched concurrently on the REST path (each needs a get_pull and a get_user call)
+_FETCH_WORKERS = 8
+
+# Pull requests resolved per GraphQL request (one aliased field each)
+_GRAPHQL_BATCH_SIZE = 50
+
+_GRAPHQL_PR_FRAGMENT = """
+fragment PullRequestFields on PullRequest {
+  number
+  title
+  body
+  url
+  merged
+  mergedAt
+  updatedAt
+  author { login ... on User { name } }
+  labels(first: 50) { nodes { name } }
+}
+"""
+
+# ETags and response bodies of GitHub GET requests are kept between runs in the
+# user's cache directory, under this subpath, so they never land in a work tree
+_ETAG_CACHE_SUBPATH = Path("rc-release-agent", "github", "etags.json")
+
+# Stored responses not used for this long are dropped, and at most this many are kept
+_ETAG_MAX_AGE_SECONDS = 30 * 24 * 3600
+_ETAG_MAX_ENTRIES = 2000
+
+
+class _ETagCache:
+    """
+    Persistent url -> (ETag, body, last used) store for conditional GitHub requests.
+    
+    GitHub answers a matching If-None-Match with 304 Not Modified, which does not
+    count against the REST rate limit, so repeat runs reuse the stored body.
+    Entries unused for _ETAG_MAX_AGE_SECONDS are dropped when the store is saved,
+    and only the _ETAG_MAX_ENTRIES most recently used are kept.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._now = int(time.time())
+        try:
+            self._entries: Dict[str, List[Any]] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._entries = {}
+    
+    def get(self, url: str) -> Optional[List[Any]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                # Entries written before last-used times were recorded have only two fields
+                self._entries[url] = entry = [entry[0], entry[1], self._now]
+                self._dirty = True
+            return entry
+    
+    def put(self, url: str, etag: str, body: str):
+        with self._lock:
+            self._entries[url] = [etag, body, self._now]
+            self._dirty = True
+    
+    def save(self):
+        """Prune stale entries and write the store to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            oldest_kept = self._now - _ETAG_MAX_AGE_SECONDS
+            recent = sorted(
+                ((url, entry) for url, entry in self._entries.items()
+                 if len(entry) > 2 and entry[2] >= oldest_kept),
+                key=lambda item: item[1][2],
+                reverse=True,
+            )
+            self._entries = dict(recent[:_ETAG_MAX_ENTRIES])
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+                # Stored bodies can include private repository data; keep them owner-only
+                os.chmod(tmp_path, 0o600)
+                tmp_path.replace(self.path)
+                self._dirty = False
+            except OSError as e:
+                get_logger(__name__).warning(f"Could not save GitHub ETag cache: {e}")
+
+
+def _etag_cache_path() -> Path:
+    """Location of the ETag store: $XDG_CACHE_HOME, or ~/.cache, per user."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / _ETAG_CACHE_SUBPATH
+
+
+@functools.lru_cache(maxsize=None)
+def _get_etag_cache() -> _ETagCache:
+    """ETag store shared by every GitHubClient in the process, written once at exit."""
+    cache = _ETagCache(_etag_cache_path())
+    atexit.register(cache.save)
+    return cache
+
+
 class GitHubClient:
     """
     GitHub client for fetching pull requests and repository information.
@@ -25,6 +141,8 @@ class GitHubClient:
     def __init__(self, config: GitHubConfig):
         self.config = config
         self.logger = get_logger(__name__)
+        # Tag names are listed once per client, see get_tag_names()
+        self._tag_names: Optional[FrozenSet[str]] = None
         
         # Initialize PyGithub client with appropriate base_url for enterprise
         if config.api_url and config.api_url != "https://api.github.com":
@@ -33,30 +151,68 @@ class GitHubClient:
             self.github = Github(
                 login_or_token=config.token,
                 base_url=config.api_url,
-                timeout=15
+                timeout=15,
+                pool_size=_POOL_SIZE
             )
         else:
             # GitHub.com
             self.logger.info("Initializing GitHub.com client")
             self.github = Github(
                 login_or_token=config.token,
-                timeout=15
+                timeout=15,
+                pool_size=_POOL_SIZE
             )
         
+        # Conditional GETs go through PyGithub's requester so auth and retries still apply;
+        # the public property only exists in PyGithub 2.x, so 1.x uses the private attribute
+        self._requester = getattr(self.github, "requester", None) or self.github._Github__requester
+        self._etags = _get_etag_cache()
+        
         try:
-            self.repo = self.github.get_repo(config.repo)
+            self.repo = self.github.create_from_raw_data(Repository, self._get_json(f"/repos/{config.repo}"))
             self.logger.info(f"Successfully initialized GitHub client for {config.repo}")
         except Exception as e:
             self.logger.error(f"Failed to initialize GitHub client for {config.repo}: {e}")
             raise
     
-    def fetch_prs_between_refs(self, old_ref: str, new_ref: str) -> List[PullRequest]:
+    def _get_json(self, url: str) -> Any:
+        """
+        GET an API path, revalidating a stored copy with its ETag when there is one.
+        
+        Args:
+            url: API path such as /repos/owner/repo
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            GithubException: If GitHub returns an error status
+        """
+        cached = self._etags.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        status, response_headers, body = self._requester.requestJson("GET", url, headers=headers)
+        
+        if status == 304 and cached:
+            return json.loads(cached[1])
+        
+        data = json.loads(body) if body else None
+        if status >= 400:
+            raise GithubException(status, data, response_headers)
+        
+        etag = response_headers.get("etag")
+        if etag:
+            self._etags.put(url, etag, body)
+        return data
+    
+    def fetch_prs_between_refs(self, old_ref: str, new_ref: str, commits: Optional[List[Any]] = None) -> List[PullRequest]:
         """
         Fetch pull requests between two Git references (tags or commit SHAs).
         
         Args:
             old_ref: Older Git reference (tag like v1.2.3 or commit SHA like abc123f)
             new_ref: Newer Git reference (tag like v1.3.0 or commit SHA like def456a)
+            commits: Commits between the references, if already fetched (see compare_refs)
             
         Returns:
             List of PullRequest objects
@@ -66,21 +222,25 @@ class GitHubClient:
         try:
             self.logger.info(f"Fetching PRs between {old_ref} and {new_ref}")
             
-            # Get commit SHAs from references (tags or commit SHAs)
-            old_commit = self._get_commit_sha(old_ref)
-            new_commit = self._get_commit_sha(new_ref)
-            
-            if not old_commit or not new_commit:
-                raise ValueError(f"Could not find commits for references {old_ref} or {new_ref}")
-            
-            # Get commits between references
-            commits = self._get_commits_between(old_commit, new_commit)
+            if commits is None:
+                # Get commit SHAs from references (tags or commit SHAs)
+                old_commit = self._get_commit_sha(old_ref)
+                new_commit = self._get_commit_sha(new_ref)
+                
+                if not old_commit or not new_commit:
+                    raise ValueError(f"Could not find commits for references {old_ref} or {new_ref}")
+                
+                # Get commits between references
+                commits = self._get_commits_between(old_commit, new_commit)
             
             # Extract PR numbers from commit messages
             pr_numbers = self._extract_pr_numbers_from_commits(commits)
             
             # Fetch full PR objects
-            prs = self._fetch_pr_objects(pr_numbers)
+            if self.config.use_graphql:
+                prs = self._fetch_pr_objects_graphql(pr_numbers)
+            else:
+                prs = self._fetch_pr_objects(pr_numbers)
             
             duration_ms = (time.time() - start_time) * 1000
             log_workflow_step(
@@ -192,6 +352,28 @@ class GitHubClient:
             self.logger.error(f"Error getting commits between {old_commit} and {new_commit}: {e}")
             raise
     
+    def compare_refs(self, old_ref: str, new_ref: str) -> List[Any]:
+        """
+        Get the commits between two references exactly as named, in one compare call.
+        
+        The compare endpoint returns 404 when either reference is missing, so this
+        doubles as a check that both exist. Pass the result to fetch_prs_between_refs
+        to avoid resolving and comparing the references again.
+        
+        Args:
+            old_ref: Older Git reference
+            new_ref: Newer Git reference
+            
+        Returns:
+            List of commit objects
+            
+        Raises:
+            GithubException: If either reference does not exist
+        """
+        commits = list(self.repo.compare(old_ref, new_ref).commits)
+        self.logger.info(f"Found {len(commits)} commits between {old_ref} and {new_ref}")
+        return commits
+    
     def _extract_pr_numbers_from_commits(self, commits: List[Any]) -> List[int]:
         """
         Extract PR numbers from commit messages.
@@ -240,28 +422,132 @@ class GitHubClient:
         Returns:
             List of PullRequest objects
         """
+        # The lookups are independent round-trips, so overlap them; map keeps PR order
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            prs = [pr for pr in executor.map(self._fetch_merged_pr, pr_numbers) if pr is not None]
+        
+        self.logger.info(f"Successfully fetched {len(prs)} merged PRs")
+        return prs
+    
+    def _fetch_merged_pr(self, pr_number: int) -> Optional[PullRequest]:
+        """
+        Fetch a single PR with enhanced user info.
+        
+        Args:
+            pr_number: PR number
+            
+        Returns:
+            PullRequest object, or None if it is unmerged or could not be fetched
+        """
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        try:
+            pr = self.github.create_from_raw_data(
+                PullRequest, self._get_json(f"/repos/{self.config.repo}/pulls/{pr_number}")
+            )
+            
+            # Only include merged PRs
+            if pr.merged:
+                # Enhance PR object with additional user info
+                self._enhance_pr_user_info(pr)
+                if debug_enabled:
+                    self.logger.debug(f"Fetched PR #{pr_number}: {pr.title}")
+                return pr
+            
+            if debug_enabled:
+                self.logger.debug(f"Skipping unmerged PR #{pr_number}")
+            return None
+            
+        except GithubException as e:
+            self.logger.warning(f"Could not fetch PR #{pr_number}: {e}")
+            return None
+    
+    def _fetch_pr_objects_graphql(self, pr_numbers: List[int]) -> List[Any]:
+        """
+        Fetch merged PRs for given PR numbers through the GraphQL API.
+        
+        Each request resolves up to _GRAPHQL_BATCH_SIZE PRs, including labels and
+        the author's name, replacing a get_pull and a get_user call per PR.
+        
+        Args:
+            pr_numbers: List of PR numbers
+            
+        Returns:
+            List of PR objects with the attributes the REST path provides
+        """
+        owner, name = self.config.repo.split("/", 1)
+        url = self._graphql_url()
         prs = []
         
-        for pr_number in pr_numbers:
-            try:
-                pr = self.repo.get_pull(pr_number)
+        with requests.Session() as session:
+            session.headers["Authorization"] = f"bearer {self.config.token}"
+            
+            for start in range(0, len(pr_numbers), _GRAPHQL_BATCH_SIZE):
+                batch = pr_numbers[start:start + _GRAPHQL_BATCH_SIZE]
+                fields = " ".join(f"pr{number}: pullRequest(number: {number}) {{ ...PullRequestFields }}" for number in batch)
+                query = (
+                    f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+                    + _GRAPHQL_PR_FRAGMENT
+                )
                 
-                # Only include merged PRs
-                if pr.merged:
-                    # Enhance PR object with additional user info
-                    self._enhance_pr_user_info(pr)
-                    prs.append(pr)
-                    self.logger.debug(f"Fetched PR #{pr_number}: {pr.title}")
-                else:
-                    self.logger.debug(f"Skipping unmerged PR #{pr_number}")
-                    
-            except GithubException as e:
-                self.logger.warning(f"Could not fetch PR #{pr_number}: {e}")
-                continue
+                start_time = time.time()
+                response = session.post(url, json={"query": query, "variables": {"owner": owner, "name": name}}, timeout=15)
+                log_api_call(
+                    self.logger,
+                    service="github",
+                    endpoint="/graphql",
+                    method="POST",
+                    status_code=response.status_code,
+                    duration_ms=(time.time() - start_time) * 1000
+                )
+                response.raise_for_status()
+                
+                payload = response.json()
+                repository = (payload.get("data") or {}).get("repository")
+                if repository is None:
+                    raise ValueError(f"GraphQL query for {self.config.repo} failed: {payload.get('errors')}")
+                
+                # Numbers that are issues rather than PRs come back as null with an error
+                for number in batch:
+                    node = repository.get(f"pr{number}")
+                    if node is None:
+                        self.logger.warning(f"Could not fetch PR #{number}")
+                    elif node["merged"]:
+                        prs.append(self._pr_from_graphql(node))
         
         self.logger.info(f"Successfully fetched {len(prs)} merged PRs")
         return prs
     
+    def _graphql_url(self) -> str:
+        """GraphQL endpoint matching the configured REST API URL."""
+        api_url = self.config.api_url.rstrip("/")
+        if api_url.endswith("/api/v3"):
+            # GitHub Enterprise serves GraphQL at /api/graphql
+            return api_url[:-len("/v3")] + "/graphql"
+        return api_url + "/graphql"
+    
+    def _pr_from_graphql(self, node: Dict[str, Any]) -> SimpleNamespace:
+        """Build a PR object from a GraphQL PullRequest node."""
+        author = node.get("author") or {}
+        login = author.get("login") or "ghost"
+        full_name = (author.get("name") or "").strip()
+        
+        return SimpleNamespace(
+            number=node["number"],
+            title=node["title"],
+            body=node["body"],
+            html_url=node["url"],
+            merged=True,
+            merged_at=_parse_github_timestamp(node["mergedAt"]),
+            updated_at=_parse_github_timestamp(node["updatedAt"]),
+            labels=[SimpleNamespace(name=label["name"]) for label in node["labels"]["nodes"]],
+            user=SimpleNamespace(
+                login=login,
+                display_name=f"{full_name} (@{login})" if full_name else f"@{login}",
+                full_name=full_name or login
+            )
+        )
+    
     def _enhance_pr_user_info(self, pr: PullRequest):
         """
         Enhance PR object with additional user information including full name.
@@ -274,7 +560,7 @@ class GitHubClient:
             user = pr.user
             if user:
                 # Try to get full name from user profile
-                user_details = self.github.get_user(user.login)
+                user_details = self.github.create_from_raw_data(NamedUser, self._get_json(f"/users/{user.login}"))
                 
                 # Add enhanced user info to the PR object
                 if not hasattr(pr.user, 'display_name'):
@@ -282,7 +568,8 @@ class GitHubClient:
                 if not hasattr(pr.user, 'full_name'):
                     pr.user.full_name = user_details.name or user.login
                     
-                self.logger.debug(f"Enhanced user info for {user.login}: {pr.user.display_name}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Enhanced user info for {user.login}: {pr.user.display_name}")
                 
         except Exception as e:
             self.logger.debug(f"Could not enhance user info for PR #{pr.number}: {e}")
@@ -363,6 +650,21 @@ class GitHubClient:
         commit = self._get_commit_sha(ref)
         return commit is not None
     
+    def get_tag_names(self) -> FrozenSet[str]:
+        """
+        Get the names of all tags in the repository.
+        
+        The tag list is fetched once per client and reused, so checking several
+        tags costs one paginated listing instead of a ref lookup (often a 404) each.
+        
+        Returns:
+            Set of tag names
+        """
+        if self._tag_names is None:
+            self._tag_names = frozenset(tag.name for tag in self.repo.get_tags())
+            self.logger.info(f"Listed {len(self._tag_names)} tags")
+        return self._tag_names
+    
     def get_latest_tags(self, limit: int = 10) -> List[str]:
         """
         Get the latest tags from the repository.
@@ -374,8 +676,12 @@ class GitHubClient:
             List of tag names (most recent first)
         """
         try:
-            tags = self.repo.get_tags()
-            tag_names = [tag.name for tag in tags[:limit]]
+            if limit <= 100:
+                # A single page; revalidated with its ETag on repeat runs
+                tags = self._get_json(f"/repos/{self.config.repo}/tags?per_page={limit}")
+                tag_names = [tag["name"] for tag in tags[:limit]]
+            else:
+                tag_names = [tag.name for tag in self.repo.get_tags()[:limit]]
             
             self.logger.info(f"Latest {len(tag_names)} tags: {tag_names}")
             return tag_names
@@ -385,6 +691,13 @@ class GitHubClient:
             return []
 
 
+def _parse_github_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp such as 2025-06-01T10:00:00Z."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def fetch_prs(prod_ref: str, new_ref: str, config: GitHubConfig) -> List[PullRequest]:
     """
     Convenience function to fetch PRs between Git references (tags or commit SHAs).
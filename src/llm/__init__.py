@@ -13,7 +13,7 @@ Supports providers: OpenAI, Anthropic, Walmart sandbox
 __version__ = "3.0.0"
 __author__ = "Arnoldo Munoz"
 
-from .wmt_gateway_adapter import call_llm
+from .wmt_gateway_adapter import call_llm, reload_llm_config
 from .prompt_templates import (
     generate_crq_prompt,
     generate_release_summary_prompt,
@@ -23,6 +23,7 @@ from .llm_client import LLMClient, LLMProvider
 
 __all__ = [
     "call_llm",
+    "reload_llm_config",
     "generate_crq_prompt",
     "generate_release_summary_prompt", 
     "generate_pr_analysis_prompt",
@@ -1,9 +1,10 @@
 # src/llm/wmt_gateway_adapter.py
 
 import os
+import functools
 import requests
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,20 +21,43 @@ else:
     # Use system default SSL certificates on macOS/Windows/other systems
     logger.info("Using system default SSL certificates")
 
-# LLM Gateway config
-LLM_GATEWAY_URL = os.getenv("WMT_LLM_API_URL")  # Get URL from environment variable
-API_KEY = os.getenv("WMT_LLM_API_KEY")  # Must be set in .env or environment
+# Set once the gateway rejects our credentials; further calls short-circuit
+_DISABLED = False
+
+# LLM Gateway config - resolved lazily so variables exported after import are honoured
+@functools.lru_cache(maxsize=1)
+def _cfg() -> Tuple[Optional[str], Optional[str]]:
+    """Read the gateway URL and API key from the environment (cached)."""
+    return os.getenv("WMT_LLM_API_URL"), os.getenv("WMT_LLM_API_KEY")
+
+
+def reload_llm_config() -> None:
+    """Drop the cached gateway configuration so the next call re-reads the environment."""
+    global _DISABLED
+    _cfg.cache_clear()
+    _DISABLED = False
+
+
+def _mark_disabled() -> None:
+    """Stop calling the gateway for the rest of the process."""
+    global _DISABLED
+    _DISABLED = True
+
 
 def call_llm(prompt: str, max_tokens: int = 300, temperature: float = 0.7) -> Optional[str]:
     """Send a prompt to Walmart's internal LLM Gateway."""
     
+    if _DISABLED:
+        return None
+    
     # Check if configuration is available
-    if not LLM_GATEWAY_URL or not API_KEY:
+    llm_gateway_url, api_key = _cfg()
+    if not llm_gateway_url or not api_key:
         logger.warning("LLM Gateway not configured (missing WMT_LLM_API_URL or WMT_LLM_API_KEY), skipping LLM call")
         return None
     
     headers = {
-        "X-Api-Key": API_KEY,
+        "X-Api-Key": api_key,
         "Content-Type": "application/json"
     }
 
@@ -51,9 +75,31 @@ def call_llm(prompt: str, max_tokens: int = 300, temperature: float = 0.7) -> Op
 
     try:
         # v4.0 Fix: Add short timeout to prevent hanging on unreachable internal URLs
-        response = requests.post(LLM_GATEWAY_URL, headers=headers, json=payload, timeout=10)
+        response = requests.post(llm_gateway_url, headers=headers, json=payload, timeout=10)
         response.raise_for_status()
         return response.json()["choices"][0]["message"]["content"]
+    except requests.exceptions.HTTPError as e:
+        status_code = e.response.status_code if e.response is not None else None
+        if status_code in (401, 403):
+            # Bad credentials won't fix themselves - skip the gateway from now on
+            logger.error(f"LLM Gateway rejected credentials ({status_code}), disabling further calls: {e}")
+            _mark_disabled()
+        else:
+            logger.error(f"LLM Gateway returned an error: {e}")
+        return None
+    except requests.exceptions.Timeout as e:
+        logger.warning(f"LLM Gateway request timed out: {e}")
+        return None
+    except requests.exceptions.ConnectionError as e:
+        logger.warning(f"LLM Gateway unreachable: {e}")
+        return None
+    except (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema,
+            requests.exceptions.InvalidSchema) as e:
+        # A malformed gateway URL is misconfiguration and won't fix itself
+        logger.error(f"LLM Gateway URL is invalid, disabling further calls: {e}")
+        _mark_disabled()
+        return None
     except requests.exceptions.RequestException as e:
+        # Anything else (broken chunked response, redirect loop, ...) may succeed next time
         logger.error(f"LLM Gateway request failed: {e}")
         return None 
\ No newline at end of file
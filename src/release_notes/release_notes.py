@@ -6,118 +6,314 @@ Generates Confluence-ready release notes from PR data using Jinja2 templates.
 """
 
 import os
+import re
+import functools
+import itertools
+import logging
+import operator
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from jinja2 import Environment, FileSystemLoader, Template
 
 from src.utils.logging import get_logger
 
 
+# Define label mappings with priority order
+# Schema gets highest priority, then international, then others
+_LABEL_MAPPINGS = {
+    "schema": ("schema", "graphql", "graphql schema", "schema change"),
+    "international": ("international", "i18n", "localization", "locale", "tenant", "multi-tenant", "internationalization"),
+    "features": ("feature", "enhancement", "new feature", "feat"),
+    "bugfixes": ("bug", "fix", "bugfix", "hotfix", "patch"),
+    "dependencies": ("dependencies", "dependency", "deps", "bump"),
+    "documentation": ("documentation", "docs", "readme"),
+    "infrastructure": ("infrastructure", "ci", "cd", "deploy", "devops", "infra")
+}
+
+# Priority-based categorization: Check schema first, then international, then others
+# Schema changes take precedence over everything else (including international)
+_PRIORITY_ORDER = tuple(_LABEL_MAPPINGS)
+
+# Category buckets in output order; "other" collects unmatched PRs
+_CATEGORY_KEYS = ("schema", "features", "bugfixes", "dependencies", "documentation", "infrastructure", "international", "other")
+
+# (category, keyword set) pairs in priority order, for exact label matches
+_LABEL_KEYWORDS = tuple((category, frozenset(_LABEL_MAPPINGS[category])) for category in _PRIORITY_ORDER)
+
+# Singular category names used in the per-PR mapping for the section generators
+# ("other" PRs are listed alongside features)
+_CATEGORY_SINGULAR = {
+    "schema": "schema",
+    "features": "feature",
+    "bugfixes": "bugfix",
+    "dependencies": "dependency",
+    "documentation": "docs",
+    "infrastructure": "infra",
+    "international": "international",
+    "other": "feature"
+}
+
+# Template variables that don't depend on the release being rendered
+_STATIC_TEMPLATE_DEFAULTS = {
+    # GitHub and version control
+    "base_branch": "main",  # Could be made configurable
+    "head_branch": "main",
+    "base_sha": "TBD",  # Would need Git integration to get actual SHAs
+    "head_sha": "TBD",
+    
+    # URLs and links
+    "slack_thread_url": "https://company.slack.com/channels/release-rc",
+    
+    # CRQ information (populated after CRQ creation)
+    "crq1_url": "TBD",
+    "crq2_url": "TBD",
+    
+    # Deployment cluster notes
+    "cluster1_notes": "Standard deployment - no special notes",
+    "cluster2_notes": "Standard deployment - no special notes",
+    "cluster3_notes": "Standard deployment - no special notes",
+    
+    # Rollback information
+    "rollback_branch": "main",
+    "rollback_sha": "TBD",
+    
+    # Schema and automation URLs
+    "schema_report_url": "TBD",
+    "automation_run_url": "TBD",
+    "test_results_url": "TBD",
+    
+    # Time defaults
+    "day1_time": "09:00",
+    "day2_time": "09:00"
+}
+
+# Deployment regions used when the organization config doesn't list enough
+_DEFAULT_REGIONS = ("EUS", "SCUS", "WUS")
+
+# Write buffer for rendered release notes, so streamed chunks are flushed in bulk
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# (PR URL, PR number) -> (updated_at, category) from earlier categorization runs, so the
+# same PR revision isn't keyword-matched again; the oldest entry is dropped at the size
+# limit. The URL keeps same-numbered PRs from different repositories apart. Renders may
+# run on several threads, so every access holds _CATEGORY_CACHE_LOCK.
+_CATEGORY_CACHE: Dict[Tuple[str, int], Tuple[Any, Optional[str]]] = {}
+_CATEGORY_CACHE_SIZE = 4096
+_CATEGORY_CACHE_LOCK = threading.Lock()
+
+# Case-insensitive word-boundary pattern for schema keywords, compiled on first use;
+# it runs on the raw body so a schema check never needs a lowercased copy
+_SCHEMA_WORD_RE = None
+
+
+def _get_schema_word_re(keywords: Tuple[str, ...]):
+    """Return the compiled word-boundary regex matching any schema keyword."""
+    global _SCHEMA_WORD_RE
+    if _SCHEMA_WORD_RE is None:
+        _SCHEMA_WORD_RE = re.compile(r'\b(' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b', re.IGNORECASE)
+    return _SCHEMA_WORD_RE
+
+
+# Config loader, imported on first use (callers usually pass a config in)
+_LOAD_CONFIG = None
+
+
+def _load_config():
+    """Load the default configuration, importing the config module only when needed."""
+    global _LOAD_CONFIG
+    if _LOAD_CONFIG is None:
+        from src.config.config import load_config
+        _LOAD_CONFIG = load_config
+    return _LOAD_CONFIG()
+
+
+class _PRView:
+    """Lowercased PR fields derived once per call, so matching doesn't re-read the PR object."""
+    
+    __slots__ = ("pr", "number", "labels_lower", "labels_blob", "title_lower", "_body_lower")
+    
+    def __init__(self, pr):
+        self.pr = pr
+        self.number = pr.number
+        
+        # Handle different PR object types (GitHub API objects, mock objects, etc.)
+        labels = getattr(pr, 'labels', None) or []
+        # Labels may be label objects or plain strings
+        self.labels_lower = frozenset(label.lower() if isinstance(label, str) else label.name.lower() for label in labels)
+        # Joined label names for substring probes; "|" never occurs in a keyword,
+        # so a match can't straddle two labels
+        self.labels_blob = "|".join(self.labels_lower)
+        
+        title = getattr(pr, 'title', None)
+        self.title_lower = title.lower() if title else ''
+        self._body_lower = None
+    
+    @property
+    def body_lower(self) -> str:
+        """Lowercased body, built on first use since bodies can be large and labels often decide."""
+        if self._body_lower is None:
+            body = getattr(self.pr, 'body', None)
+            self._body_lower = body.lower() if body else ''
+        return self._body_lower
+
+
 def categorize_prs(prs: List) -> Dict[str, List]:
     """Categorize PRs by their labels for better organization with proper priority."""
+    return _categorize_prs(prs).buckets
+
+
+def clear_category_cache() -> None:
+    """Forget memoized PR categories (e.g., after changing keyword mappings in tests)."""
+    with _CATEGORY_CACHE_LOCK:
+        _CATEGORY_CACHE.clear()
+
+
+@dataclass
+class _Categorized:
+    """Category buckets plus the PR number -> singular category lookup, from one pass."""
+    
+    __slots__ = ("buckets", "lookup")
+    
+    buckets: Dict[str, List]
+    lookup: Dict[int, str]
+
+
+def _categorize_prs(prs: List) -> _Categorized:
+    """
+    Categorize PRs and build the PR number -> singular category mapping in one pass.
+    
+    PRs that carry an ``updated_at`` timestamp and an ``html_url`` reuse the category
+    computed the last time the same revision was seen, so repeated renders skip
+    keyword matching.
+    
+    Args:
+        prs: List of PR objects
+        
+    Returns:
+        _Categorized with the category buckets and the mapping of each PR number
+        to the singular category name used by the section generators
+    """
     logger = get_logger(__name__)
     
-    categories = {
-        "schema": [],
-        "features": [],
-        "bugfixes": [],
-        "dependencies": [],
-        "documentation": [],
-        "infrastructure": [],
-        "international": [],
-        "other": []
-    }
-    
-    # Define label mappings with priority order
-    # Schema gets highest priority, then international, then others
-    label_mappings = {
-        "schema": ["schema", "graphql", "graphql schema", "schema change"],
-        "international": ["international", "i18n", "localization", "locale", "tenant", "multi-tenant", "internationalization"],
-        "features": ["feature", "enhancement", "new feature", "feat"],
-        "bugfixes": ["bug", "fix", "bugfix", "hotfix", "patch"],
-        "dependencies": ["dependencies", "dependency", "deps", "bump"],
-        "documentation": ["documentation", "docs", "readme"],
-        "infrastructure": ["infrastructure", "ci", "cd", "deploy", "devops", "infra"]
-    }
+    pr_categories = {}
+    categories = {key: [] for key in _CATEGORY_KEYS}
+    # Bound append and singular name per category, so placing a PR is a single lookup
+    targets = {key: (bucket.append, _CATEGORY_SINGULAR[key]) for key, bucket in categories.items()}
+    
+    schema_word_re = _get_schema_word_re(_LABEL_MAPPINGS["schema"])
+    # Best label-match rank per distinct label set
+    label_set_ranks = {}
     
     for pr in prs:
-        categorized = False
-        
-        # Handle different PR object types (GitHub API objects, mock objects, etc.)
-        if hasattr(pr, 'labels') and pr.labels:
-            pr_labels = [label.name.lower() for label in pr.labels]
-        elif hasattr(pr, 'labels') and isinstance(pr.labels, list):
-            # Handle case where labels is a list of strings
-            pr_labels = [label.lower() if isinstance(label, str) else label.name.lower() for label in pr.labels]
+        number = pr.number
+        updated_at = getattr(pr, 'updated_at', None)
+        html_url = getattr(pr, 'html_url', None)
+        cache_key = (html_url, number) if updated_at is not None and html_url else None
+        cached = None
+        if cache_key is not None:
+            with _CATEGORY_CACHE_LOCK:
+                cached = _CATEGORY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == updated_at:
+            matched_category = cached[1]
         else:
-            pr_labels = []
-        
-        pr_title_lower = pr.title.lower() if hasattr(pr, 'title') else ''
-        pr_body_lower = getattr(pr, 'body', '').lower() if hasattr(pr, 'body') and pr.body else ''
-        
-        # Priority-based categorization: Check schema first, then international, then others
-        # Schema changes take precedence over everything else (including international)
-        priority_order = ["schema", "international", "features", "bugfixes", "dependencies", "documentation", "infrastructure"]
-        
-        for category in priority_order:
-            if category not in label_mappings:
-                continue
-                
-            keywords = label_mappings[category]
-            
-            # Check for matches in labels (both exact and substring), title, and body
-            category_matched = False
-            
-            # Enhanced label matching: check both exact label names and substring matches
-            for keyword in keywords:
-                # Check for exact label matches (e.g., label named exactly "schema")
-                if keyword in pr_labels:
-                    category_matched = True
-                    break
-                
-                # Check for substring matches in label names (e.g., "schema-update" contains "schema")  
-                if any(keyword in label for label in pr_labels):
-                    category_matched = True
-                    break
-                
-                # Check in title and body as fallback - but only for schema category use word boundaries
-                # to avoid false positives like "api" in "analyzer"
-                if category == "schema":
-                    # Use word boundaries for schema keywords to avoid false positives
-                    import re
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    if re.search(pattern, pr_title_lower) or re.search(pattern, pr_body_lower):
-                        category_matched = True
-                        break
-                else:
-                    # For other categories, use substring matching
-                    if keyword in pr_title_lower or keyword in pr_body_lower:
-                        category_matched = True
-                        break
-            
-            if category_matched:
-                categories[category].append(pr)
-                categorized = True
-                logger.debug(f"PR #{pr.number} categorized as '{category}' based on labels: {[label.name for label in pr.labels]}")
-                break
+            matched_category = _match_category(_PRView(pr), schema_word_re, label_set_ranks)
+            if cache_key is not None:
+                with _CATEGORY_CACHE_LOCK:
+                    # Re-inserted entries move to the end, so the first key is the oldest
+                    _CATEGORY_CACHE.pop(cache_key, None)
+                    if len(_CATEGORY_CACHE) >= _CATEGORY_CACHE_SIZE:
+                        del _CATEGORY_CACHE[next(iter(_CATEGORY_CACHE))]
+                    _CATEGORY_CACHE[cache_key] = (updated_at, matched_category)
         
         # If no category found, put in "other"
-        if not categorized:
-            categories["other"].append(pr)
-            logger.debug(f"PR #{pr.number} categorized as 'other' - no matching labels found")
+        append, pr_categories[number] = targets[matched_category or "other"]
+        append(pr)
+        if logger.isEnabledFor(logging.DEBUG):
+            if matched_category:
+                logger.debug(f"PR #{number} categorized as '{matched_category}' based on labels: {[label.name for label in pr.labels]}")
+            else:
+                logger.debug(f"PR #{number} categorized as 'other' - no matching labels found")
     
     # Log categorization results
     for category, prs_in_category in categories.items():
         if prs_in_category:
             logger.info(f"  {category}: {len(prs_in_category)} PRs")
     
-    return categories
+    return _Categorized(categories, pr_categories)
 
 
-def create_confluence_template() -> Template:
-    """Create the Confluence wiki markup template."""
-    template_content = """h1. Release Notes - {{ service_name }} {{ new_version }}
+def _match_category(view: _PRView, schema_word_re, label_set_ranks: Dict[frozenset, int]) -> Optional[str]:
+    """Return the highest-priority category matching a PR, or None if nothing matches."""
+    pr_labels = view.labels_lower
+    pr_title_lower = view.title_lower
+    
+    # Labels are checked in priority order. A label that exactly matches a keyword is
+    # a set intersection; otherwise look for keywords inside label names
+    # (e.g., "schema-update" contains "schema"). Large releases reuse a handful of
+    # label combinations, so the result is remembered per label set for the rest of
+    # the categorization call.
+    best_rank = label_set_ranks.get(pr_labels)
+    if best_rank is None:
+        best_rank = len(_PRIORITY_ORDER)
+        for rank, (category, keywords) in enumerate(_LABEL_KEYWORDS):
+            if not keywords.isdisjoint(pr_labels) or any(keyword in view.labels_blob for keyword in _LABEL_MAPPINGS[category]):
+                best_rank = rank
+                break
+        label_set_ranks[pr_labels] = best_rank
+    
+    # Title and body can only promote the PR to a category ranked above the best label
+    # match. Schema keywords use word boundaries to avoid false positives like "api" in
+    # "analyzer"; other categories use substring matching. The title is checked first so
+    # the (often large) body is only scanned for categories ranked above every hit so far.
+    for rank in range(best_rank):
+        category = _PRIORITY_ORDER[rank]
+        if category == "schema":
+            category_matched = schema_word_re.search(pr_title_lower)
+        else:
+            category_matched = any(keyword in pr_title_lower for keyword in _LABEL_MAPPINGS[category])
+        if category_matched:
+            best_rank = rank
+            break
+    
+    body = getattr(view.pr, 'body', None) if best_rank else None
+    if body:
+        for rank in range(best_rank):
+            category = _PRIORITY_ORDER[rank]
+            if category == "schema":
+                category_matched = schema_word_re.search(body)
+            else:
+                pr_body_lower = view.body_lower
+                category_matched = any(keyword in pr_body_lower for keyword in _LABEL_MAPPINGS[category])
+            if category_matched:
+                best_rank = rank
+                break
+    
+    return _PRIORITY_ORDER[best_rank] if best_rank < len(_PRIORITY_ORDER) else None
+
+
+# On-disk templates, located from this module so the working directory doesn't matter
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_env() -> Environment:
+    """Return the shared Jinja2 environment for the on-disk templates."""
+    return Environment(
+        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+        auto_reload=False,
+        autoescape=False,  # Confluence wiki markup, not HTML
+        cache_size=50,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+# Confluence wiki markup template used when the custom template file is unavailable
+_CONFLUENCE_TEMPLATE_SRC = """h1. Release Notes - {{ service_name }} {{ new_version }}
 
 *Release Date:* {{ release_date }}  
 *Release Coordinator:* {{ rc_name }}  
@@ -158,8 +354,8 @@ h2. ✨ New Features
 
 {% for pr in categories.features %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
-  * Labels: {{ pr.labels|map(attribute='name')|join(', ') or 'None' }}
+  * Author: {{ pr_authors[pr.number] }}
+  * Labels: {{ pr_labels[pr.number] or 'None' }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -170,8 +366,8 @@ h2. 🐛 Bug Fixes
 
 {% for pr in categories.bugfixes %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
-  * Labels: {{ pr.labels|map(attribute='name')|join(', ') or 'None' }}
+  * Author: {{ pr_authors[pr.number] }}
+  * Labels: {{ pr_labels[pr.number] or 'None' }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -182,7 +378,7 @@ h2. 📦 Dependency Updates
 
 {% for pr in categories.dependencies %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
+  * Author: {{ pr_authors[pr.number] }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -193,7 +389,7 @@ h2. 📚 Documentation Updates
 
 {% for pr in categories.documentation %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
+  * Author: {{ pr_authors[pr.number] }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -204,7 +400,7 @@ h2. 🔧 Infrastructure Changes
 
 {% for pr in categories.infrastructure %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
+  * Author: {{ pr_authors[pr.number] }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -215,8 +411,8 @@ h2. 🌍 International Changes
 
 {% for pr in categories.international %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
-  * Labels: {{ pr.labels|map(attribute='name')|join(', ') or 'None' }}
+  * Author: {{ pr_authors[pr.number] }}
+  * Labels: {{ pr_labels[pr.number] or 'None' }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -227,8 +423,8 @@ h2. 🔹 Other Changes
 
 {% for pr in categories.other %}
 * *PR #{{ pr.number }}:* {{ pr.title }}
-  * Author: {{ pr.user.display_name if pr.user.display_name else '@' + pr.user.login }}
-  * Labels: {{ pr.labels|map(attribute='name')|join(', ') or 'None' }}
+  * Author: {{ pr_authors[pr.number] }}
+  * Labels: {{ pr_labels[pr.number] or 'None' }}
   * [View PR|{{ pr.html_url }}]
 
 {% endfor %}
@@ -264,7 +460,40 @@ h2. 📞 Contact Information
 *Generated automatically by RC Release Automation on {{ generation_timestamp }}*
 """
 
-    return Template(template_content)
+_CONFLUENCE_FALLBACK_TEMPLATE = Template(_CONFLUENCE_TEMPLATE_SRC)
+
+
+def create_confluence_template() -> Template:
+    """Return the built-in Confluence wiki markup template."""
+    return _CONFLUENCE_FALLBACK_TEMPLATE
+
+
+@functools.lru_cache(maxsize=1)
+def _load_release_notes_template() -> Template:
+    """Resolve the release notes template once: the custom file if present, else the built-in one."""
+    template_path = _TEMPLATES_DIR / "release_notes.j2"
+    logger = get_logger(__name__)
+    logger.info(f"Checking template path: {template_path}")
+    
+    if template_path.exists():
+        return _get_env().get_template("release_notes.j2")
+    return create_confluence_template()
+
+
+def _pr_authors(prs: List) -> Dict[int, str]:
+    """Map each PR number to the author name the renderers print."""
+    return {pr.number: _author_display(pr.user.login, getattr(pr.user, 'display_name', None)) for pr in prs}
+
+
+def _pr_labels(prs: List) -> Dict[int, str]:
+    """Map each PR number to the comma-separated label names the renderers print."""
+    return {pr.number: ", ".join([label.name for label in pr.labels]) for pr in prs}
+
+
+def _dump_template(template: Template, template_vars: Dict[str, Any], output_file: Path) -> None:
+    """Stream a rendered template to disk through a large write buffer."""
+    with open(output_file, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as f:
+        template.stream(**template_vars).dump(f)
 
 
 def render_release_notes(prs: List, params: Dict[str, Any], output_dir: Path, config=None) -> Path:
@@ -285,8 +514,7 @@ def render_release_notes(prs: List, params: Dict[str, Any], output_dir: Path, co
     try:
         # Load configuration if not provided
         if config is None:
-            from src.config.config import load_config
-            config = load_config()
+            config = _load_config()
         
         # Setup output directory
         output_dir = Path(output_dir)
@@ -294,116 +522,103 @@ def render_release_notes(prs: List, params: Dict[str, Any], output_dir: Path, co
         
         # Categorize PRs for better organization
         logger.info(f"Categorizing {len(prs)} PRs...")
-        categories = categorize_prs(prs)
+        categorized = _categorize_prs(prs)
+        categories, pr_categories = categorized.buckets, categorized.lookup
+        
+        # Resolve author names and label lists once instead of in every template loop
+        pr_authors = _pr_authors(prs)
+        pr_labels = _pr_labels(prs)
         
         # Use only PRs that were categorized as "international" (not moved to "schema" due to priority)
         international_prs = categories.get('international', [])
         logger.info(f"Found {len(international_prs)} international/tenant PRs (after priority filtering)")
         
-        # Create PR categories mapping for template
-        pr_categories = {}
-        for category, prs_in_category in categories.items():
-            for pr in prs_in_category:
-                if category == "schema":
-                    pr_categories[pr.number] = "schema"
-                elif category == "features":
-                    pr_categories[pr.number] = "feature"
-                elif category == "bugfixes":
-                    pr_categories[pr.number] = "bugfix"
-                elif category == "dependencies":
-                    pr_categories[pr.number] = "dependency"
-                elif category == "documentation":
-                    pr_categories[pr.number] = "docs"
-                elif category == "infrastructure":
-                    pr_categories[pr.number] = "infra"
-                elif category == "international":
-                    pr_categories[pr.number] = "international"
-                else:
-                    pr_categories[pr.number] = "feature"
-        
         # Extract GitHub repository info from config
         github_repo = getattr(config.github, 'repo', 'company/repo')
         
+        # Release parameters used throughout the template variables
+        service_name = params["service_name"]
+        new_version = params["new_version"]
+        prod_version = params["prod_version"]
+        release_type = params["release_type"]
+        rc_name = params["rc_name"]
+        rc_manager = params["rc_manager"]
+        day1_date = params["day1_date"]
+        day2_date = params["day2_date"]
+        # Dates without separators, as used in CRQ identifiers
+        day1_compact = day1_date.replace('-', '')
+        day2_compact = day2_date.replace('-', '')
+        
+        # Deployment clusters, falling back to the default region for each missing slot
+        regions = list(getattr(config.organization, 'regions', None) or [])
+        cluster1, cluster2, cluster3 = (regions + list(_DEFAULT_REGIONS[len(regions):]))[:3]
+        
         # Prepare comprehensive template variables
         template_vars = {
+            **_STATIC_TEMPLATE_DEFAULTS,
+            
             # Basic release information
-            "service_name": params["service_name"],
-            "new_version": params["new_version"],
-            "prod_version": params["prod_version"],
-            "release_type": params["release_type"],
-            "rc_name": params["rc_name"],
-            "rc_manager": params["rc_manager"],
-            "day1_date": params["day1_date"],
-            "day2_date": params["day2_date"],
-            "release_date": params["day2_date"],  # Use Day 2 as release date
+            "service_name": service_name,
+            "new_version": new_version,
+            "prod_version": prod_version,
+            "release_type": release_type,
+            "rc_name": rc_name,
+            "rc_manager": rc_manager,
+            "day1_date": day1_date,
+            "day2_date": day2_date,
+            "release_date": day2_date,  # Use Day 2 as release date
             "total_prs": len(prs),
             "generation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC"),
             
             # GitHub and version control
             "github_repo": github_repo,
-            "base_branch": "main",  # Could be made configurable
-            "head_branch": "main",
-            "base_sha": "TBD",  # Would need Git integration to get actual SHAs
-            "head_sha": "TBD",
             
             # URLs and links
-            "slack_thread_url": f"https://company.slack.com/channels/release-rc",
-            "diff_url": f"https://github.com/{github_repo}/compare/{params['prod_version']}...{params['new_version']}",
-            "grafana_url": f"https://grafana.company.com/d/{params['service_name']}-dashboard",
-            "dashboard_url": f"https://dashboard.company.com/{params['service_name']}",
-            "datadog_url": f"https://app.datadoghq.com/apm/services/{params['service_name']}",
-            "alerts_url": f"https://alerts.company.com/{params['service_name']}",
+            "diff_url": f"https://github.com/{github_repo}/compare/{prod_version}...{new_version}",
+            "grafana_url": f"https://grafana.company.com/d/{service_name}-dashboard",
+            "dashboard_url": f"https://dashboard.company.com/{service_name}",
+            "datadog_url": f"https://app.datadoghq.com/apm/services/{service_name}",
+            "alerts_url": f"https://alerts.company.com/{service_name}",
             
             # CRQ information
-            "crq1_id": f"CRQ-{params['service_name']}-{params['day1_date'].replace('-', '')}",
-            "crq1_url": "TBD",  # Would be populated after CRQ creation
-            "crq2_id": f"CRQ-{params['service_name']}-{params['day2_date'].replace('-', '')}",
-            "crq2_url": "TBD",
+            "crq1_id": f"CRQ-{service_name}-{day1_compact}",
+            "crq2_id": f"CRQ-{service_name}-{day2_compact}",
             
             # Release team (defaults from params if not in config)
-            "idc_captain": getattr(config.organization, 'idc_captain', params['rc_name']),
-            "idc_engineer": getattr(config.organization, 'idc_engineer', params['rc_name']),
-            "us_captain": getattr(config.organization, 'us_captain', params['rc_manager']),
-            "us_engineer": getattr(config.organization, 'us_engineer', params['rc_manager']),
+            "idc_captain": getattr(config.organization, 'idc_captain', rc_name),
+            "idc_engineer": getattr(config.organization, 'idc_engineer', rc_name),
+            "us_captain": getattr(config.organization, 'us_captain', rc_manager),
+            "us_engineer": getattr(config.organization, 'us_engineer', rc_manager),
             
             # Deployment clusters
-            "cluster1": getattr(config.organization, 'regions', ['EUS'])[0] if hasattr(config.organization, 'regions') else 'EUS',
-            "cluster2": getattr(config.organization, 'regions', ['EUS', 'SCUS'])[1] if len(getattr(config.organization, 'regions', [])) > 1 else 'SCUS',
-            "cluster3": getattr(config.organization, 'regions', ['EUS', 'SCUS', 'WUS'])[2] if len(getattr(config.organization, 'regions', [])) > 2 else 'WUS',
-            "cluster1_notes": "Standard deployment - no special notes",
-            "cluster2_notes": "Standard deployment - no special notes", 
-            "cluster3_notes": "Standard deployment - no special notes",
+            "cluster1": cluster1,
+            "cluster2": cluster2,
+            "cluster3": cluster3,
             
             # Rollback information
-            "rollback_branch": "main",
-            "rollback_version": params["prod_version"],
-            "rollback_sha": "TBD",
+            "rollback_version": prod_version,
             
             # PR data and categorization
             "prs": prs,
             "pr_categories": pr_categories,
             "categories": categories,
+            "pr_authors": pr_authors,
+            "pr_labels": pr_labels,
             
             # International PRs (now properly filtered)
             "international_prs": international_prs,
             "ccm_updates": [],  # Would come from external system
-            
-            # Schema and automation URLs
-            "schema_report_url": "TBD",
-            "automation_run_url": "TBD", 
-            "test_results_url": "TBD",
-            
-            # Time defaults
-            "day1_time": "09:00",
-            "day2_time": "09:00"
         }
         
         # === VERSION 3.0 - AI-POWERED RELEASE SUMMARY GENERATION ===
         logger.info("Generating AI-powered release summary...")
-        section_8_markup = generate_ai_release_summary(prs, config)
+        section_8_markup = generate_ai_release_summary(
+            prs, config, categories=categories,
+            international_pr_numbers={pr.number for pr in international_prs}
+        )
         
         # Generate section 9 (schema/features) and section 10 (international)
-        section_9_markup = generate_schema_and_features_section_markup(prs, pr_categories)  # Now section 9 - Schema & Features
+        section_9_markup = generate_schema_and_features_section_markup(categories, pr_categories)  # Now section 9 - Schema & Features
         section_10_markup = generate_international_section_markup(international_prs)  # Now section 10 - International
         
         # Add pre-generated sections to template vars
@@ -416,36 +631,27 @@ def render_release_notes(prs: List, params: Dict[str, Any], output_dir: Path, co
         logger.info(f"Section 9 (Schema/Features) preview: {section_9_markup[:150]}...")
         logger.info(f"Section 10 (International) preview: {section_10_markup[:150]}...")
         
-        # Load and render template
+        # Load and render template, streaming the output straight to disk
+        output_file = output_dir / "release_notes.txt"
         try:
-            # Try to load custom template first
-            template_path = Path("src/templates/release_notes.j2")
-            logger.info(f"Checking template path: {template_path.absolute()}")
-            logger.info(f"Template exists: {template_path.exists()}")
-            
-            if template_path.exists():
-                env = Environment(loader=FileSystemLoader("src/templates"))
-                template = env.get_template("release_notes.j2")
-                logger.info("Loading custom template successfully")
-                rendered_content = template.render(**template_vars)
-            else:
-                # Fall back to built-in template
+            # Try to load custom template first (falls back to the built-in template)
+            template = _load_release_notes_template()
+            if template is _CONFLUENCE_FALLBACK_TEMPLATE:
                 logger.warning("Custom template not found, using built-in template")
-                template = create_confluence_template()
-                rendered_content = template.render(**template_vars)
+            else:
+                logger.info("Loading custom template successfully")
+            _dump_template(template, template_vars, output_file)
         except Exception as template_error:
             logger.warning(f"Template rendering failed: {template_error}, using fallback")
             # Use the simple built-in template as fallback
             template = create_confluence_template()
-            rendered_content = template.render(**template_vars)
-        
-        # Save to file
-        output_file = output_dir / "release_notes.txt"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(rendered_content)
+            _dump_template(template, template_vars, output_file)
         
         logger.info(f"Release notes generated successfully: {output_file}")
-        logger.info(f"Content preview (first 200 chars): {rendered_content[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Only the leading chunks are rendered for the preview
+            preview = "".join(itertools.islice(template.stream(**template_vars), 20))[:200]
+            logger.debug(f"Content preview (first 200 chars): {preview}...")
         
         return output_file
         
@@ -454,13 +660,17 @@ def render_release_notes(prs: List, params: Dict[str, Any], output_dir: Path, co
         raise
 
 
-def generate_ai_release_summary(prs: List, config) -> str:
+def generate_ai_release_summary(prs: List, config, categories: Optional[Dict[str, List]] = None,
+                                international_pr_numbers: Optional[Set[int]] = None) -> str:
     """
     Generate AI-powered release summary for Section 8.
     
     Args:
         prs: List of PR objects
         config: Configuration object with LLM settings
+        categories: Optional result of categorize_prs(prs), reused by the fallback summary
+        international_pr_numbers: Optional numbers of PRs already categorized as international;
+            when omitted each PR is checked with is_international_pr
         
     Returns:
         Formatted release summary markup
@@ -472,7 +682,7 @@ def generate_ai_release_summary(prs: List, config) -> str:
         llm_config = getattr(config, 'llm', None)
         if not llm_config or not getattr(llm_config, 'enabled', False):
             logger.info("LLM is disabled, using fallback summary")
-            return generate_fallback_summary(prs)
+            return generate_fallback_summary(prs, categories)
         
         # Import LLM client
         from src.llm.llm_client import LLMClient
@@ -483,8 +693,12 @@ def generate_ai_release_summary(prs: List, config) -> str:
             pr_data = {
                 "number": pr.number,
                 "title": pr.title,
-                "author": getattr(pr.user, 'display_name', None) or f"@{pr.user.login}",
-                "is_international": is_international_pr(pr, config)
+                "author": _author_display(pr.user.login, getattr(pr.user, 'display_name', None)),
+                "is_international": (
+                    pr.number in international_pr_numbers
+                    if international_pr_numbers is not None
+                    else is_international_pr(pr, config)
+                )
             }
             pr_list.append(pr_data)
         
@@ -500,24 +714,26 @@ def generate_ai_release_summary(prs: List, config) -> str:
             return ai_summary.strip()
         else:
             logger.warning("AI summary generation failed, using fallback")
-            return generate_fallback_summary(prs)
+            return generate_fallback_summary(prs, categories)
             
     except Exception as e:
         logger.error(f"Error generating AI summary: {e}")
-        return generate_fallback_summary(prs)
+        return generate_fallback_summary(prs, categories)
 
 
-def generate_fallback_summary(prs: List) -> str:
+def generate_fallback_summary(prs: List, categories: Optional[Dict[str, List]] = None) -> str:
     """
     Generate a basic fallback summary when LLM is unavailable.
     
     Args:
         prs: List of PR objects
+        categories: Optional result of categorize_prs(prs); computed if not given
         
     Returns:
         Basic summary string
     """
-    categories = categorize_prs(prs)
+    if categories is None:
+        categories = categorize_prs(prs)
     
     # Count different types of changes
     feature_count = len(categories.get('features', []))
@@ -549,6 +765,13 @@ def generate_fallback_summary(prs: List) -> str:
     return summary
 
 
+@functools.lru_cache(maxsize=4)
+def _international_keywords(international_labels: Tuple[str, ...]) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Return the lowercased international keywords as a set and a deduplicated tuple."""
+    keywords = tuple(dict.fromkeys(label.lower() for label in international_labels))
+    return frozenset(keywords), keywords
+
+
 def is_international_pr(pr, config) -> bool:
     """
     Check if a PR is related to international/tenant features.
@@ -566,28 +789,22 @@ def is_international_pr(pr, config) -> bool:
             'international', 'i18n', 'localization', 'locale', 'tenant', 'multi-tenant'
         ])
         
+        keyword_set, keywords = _international_keywords(tuple(international_labels))
+        
         # Check PR labels, title, and body
         pr_labels = [label.name.lower() for label in pr.labels] if hasattr(pr, 'labels') else []
         pr_title = pr.title.lower() if hasattr(pr, 'title') else ''
         pr_body = getattr(pr, 'body', '').lower() if hasattr(pr, 'body') and pr.body else ''
         
-        # Check if any international label/keyword is present using enhanced matching
-        for label in international_labels:
-            keyword = label.lower()
-            
-            # Check for exact label matches (e.g., label named exactly "international")
-            if keyword in pr_labels:
-                return True
-            
-            # Check for substring matches in label names (e.g., "international-feature" contains "international")
-            if any(keyword in pr_label for pr_label in pr_labels):
-                return True
-            
-            # Check in title and body as fallback
-            if keyword in pr_title or keyword in pr_body:
-                return True
+        # Check for exact label matches (e.g., label named exactly "international")
+        if not keyword_set.isdisjoint(pr_labels):
+            return True
         
-        return False
+        # Check for substring matches in label names (e.g., "international-feature" contains
+        # "international"), then in title and body as fallback. The NUL separator keeps a
+        # keyword from matching across two fields.
+        haystack = "\0".join(pr_labels + [pr_title, pr_body])
+        return any(keyword in haystack for keyword in keywords)
         
     except Exception as e:
         logger = get_logger(__name__)
@@ -595,6 +812,25 @@ def is_international_pr(pr, config) -> bool:
         return False
 
 
+# Category headings for the markdown release notes
+_MARKDOWN_CATEGORY_NAMES = {
+    "schema": "🔗 Schema Changes",
+    "features": "✨ New Features",
+    "bugfixes": "🐛 Bug Fixes",
+    "dependencies": "📦 Dependency Updates",
+    "documentation": "📚 Documentation Updates",
+    "infrastructure": "🔧 Infrastructure Changes",
+    "other": "🔹 Other Changes"
+}
+
+# (summary label, detail section header) per category for the markdown release notes
+_CATEGORY_HEADERS = {
+    category: (name, f"\n## {name}\n\n")
+    for category in _CATEGORY_KEYS
+    for name in [_MARKDOWN_CATEGORY_NAMES.get(category, f"🔹 {category.title()} Changes")]
+}
+
+
 def render_release_notes_markdown(prs: List, params: Dict[str, Any], output_dir: Path, config=None) -> Path:
     """Alternative markdown format for GitHub/GitLab."""
     logger = get_logger(__name__)
@@ -602,12 +838,12 @@ def render_release_notes_markdown(prs: List, params: Dict[str, Any], output_dir:
     try:
         # Load configuration if not provided
         if config is None:
-            from src.config.config import load_config
-            config = load_config()
+            config = _load_config()
         
         categories = categorize_prs(prs)
+        pr_labels = _pr_labels(prs)
         
-        markdown_content = f"""# Release Notes - {params['service_name']} {params['new_version']}
+        parts = [f"""# Release Notes - {params['service_name']} {params['new_version']}
 
 **Release Date:** {params['day2_date']}  
 **Release Coordinator:** {params['rc_name']}  
@@ -620,51 +856,27 @@ def render_release_notes_markdown(prs: List, params: Dict[str, Any], output_dir:
 
 This release includes {len(prs)} pull request(s) with the following changes:
 
-"""
+"""]
         
         # Add summary by category
         for category, prs_in_category in categories.items():
             if prs_in_category:
-                category_names = {
-                    "schema": "🔗 Schema Changes",
-                    "features": "✨ New Features",
-                    "bugfixes": "🐛 Bug Fixes", 
-                    "dependencies": "📦 Dependency Updates",
-                    "documentation": "📚 Documentation Updates",
-                    "infrastructure": "🔧 Infrastructure Changes",
-                    "other": "🔹 Other Changes"
-                }
-                category_name = category_names.get(category, f"🔹 {category.title()} Changes")
-                markdown_content += f"* **{len(prs_in_category)} {category_name}**\n"
+                parts.append(f"* **{len(prs_in_category)} {_CATEGORY_HEADERS[category][0]}**\n")
         
         # Add detailed sections
         for category, prs_in_category in categories.items():
             if prs_in_category:
-                category_names = {
-                    "schema": "## 🔗 Schema Changes",
-                    "features": "## ✨ New Features",
-                    "bugfixes": "## 🐛 Bug Fixes",
-                    "dependencies": "## 📦 Dependency Updates", 
-                    "documentation": "## 📚 Documentation Updates",
-                    "infrastructure": "## 🔧 Infrastructure Changes",
-                    "other": "## 🔹 Other Changes"
-                }
-                
-                category_header = category_names.get(category, f"## 🔹 {category.title()} Changes")
-                markdown_content += f"\n{category_header}\n\n"
+                parts.append(_CATEGORY_HEADERS[category][1])
                 
                 for pr in prs_in_category:
-                    labels = ", ".join([label.name for label in pr.labels]) or "None"
-                    markdown_content += f"* **PR #{pr.number}:** {pr.title}\n"
-                    markdown_content += f"  * Author: @{pr.user.login}\n"
-                    if labels != "None":
-                        markdown_content += f"  * Labels: {labels}\n"
-                    markdown_content += f"  * [View PR]({pr.html_url})\n\n"
+                    parts.append(f"* **PR #{pr.number}:** {pr.title}\n  * Author: @{pr.user.login}\n")
+                    if pr_labels[pr.number]:
+                        parts.append(f"  * Labels: {pr_labels[pr.number]}\n")
+                    parts.append(f"  * [View PR]({pr.html_url})\n\n")
         
         # Save markdown version
         markdown_file = output_dir / "release_notes.md"
-        with open(markdown_file, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        markdown_file.write_text("".join(parts), encoding="utf-8")
             
         logger.info(f"Markdown release notes generated: {markdown_file}")
         return markdown_file
@@ -674,6 +886,28 @@ This release includes {len(prs)} pull request(s) with the following changes:
         raise
 
 
+def _author_display(login: Optional[str], display_name: Optional[str]) -> str:
+    """Return the enhanced display name if set, falling back to @username."""
+    if display_name:
+        return display_name
+    return f"@{login}" if login else "Unknown"
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Sort key for listing PRs by number
+_PR_NUMBER = operator.attrgetter('number')
+
+# PR fields read for every section table row
+_PR_ROW_FIELDS = operator.attrgetter('number', 'html_url', 'title', 'user')
+
+# Shared read-only default for optional mapping attributes (e.g., screenshots)
+_EMPTY = MappingProxyType({})
+
+
 def generate_confluence_section_with_panels(section_num: int, section_title: str, panels: List[Dict[str, Any]]) -> str:
     """
     Generate a Confluence wiki markup section with inline panels to avoid table structure breaking.
@@ -693,53 +927,56 @@ def generate_confluence_section_with_panels(section_num: int, section_title: str
     """
     
     # Start the section row
-    markup = f"|| {section_num} || {section_title} || "
+    parts = [f"|| {section_num} || {section_title} || "]
     
     # Generate each panel inline
-    for i, panel in enumerate(panels):
+    for panel in panels:
         bg_color = panel.get('bg_color', '#F7F7F7')
         
         # Panel opening
-        markup += f"{{panel:title={panel['title']}|borderStyle=solid|borderColor=#ccc|titleBGColor={bg_color}|bgColor=#FFFFFF}}"
+        parts.append(f"{{panel:title={panel['title']}|borderStyle=solid|borderColor=#ccc|titleBGColor={bg_color}|bgColor=#FFFFFF}}")
         
         # Add description if provided
         if panel.get('description'):
-            markup += panel['description'] + "\n\n"
+            parts.append(panel['description'] + "\n\n")
         
         # Add table headers
         headers = panel.get('headers', [])
         if headers:
-            markup += "|| " + " || ".join(headers) + " ||\n"
+            parts.append("|| " + " || ".join(headers) + " ||\n")
         
         # Add table rows
         rows = panel.get('rows', [])
         for row in rows:
-            markup += "| " + " | ".join(str(cell) for cell in row) + " |\n"
+            parts.append("| " + " | ".join(map(str, row)) + " |\n")
         
         # Panel closing
-        markup += "{panel}"
+        parts.append("{panel}")
     
     # Close the section row
-    markup += " ||"
+    parts.append(" ||")
     
-    return markup
+    return "".join(parts)
 
 
-def generate_schema_and_features_section_markup(prs: List, pr_categories: Dict[int, str]) -> str:
+def generate_schema_and_features_section_markup(categories: Dict[str, List], pr_categories: Dict[int, str]) -> str:
     """
     Generate Section 9 (GraphQL Schema Changes) with both Schema and Features/Bugfixes panels.
     
     Args:
-        prs: List of GitHub PR objects
+        categories: Category buckets from categorize_prs
         pr_categories: Dictionary mapping PR numbers to categories
         
     Returns:
         Confluence wiki markup for section 9
     """
     
-    # Separate schema PRs from feature/bugfix PRs
-    schema_prs = [pr for pr in prs if pr_categories.get(pr.number) == 'schema']
-    feature_bugfix_prs = [pr for pr in prs if pr_categories.get(pr.number) in ['feature', 'bugfix', 'enhancement', 'other']]
+    # Schema PRs, and feature/bugfix PRs ("other" changes are listed as features) by PR number
+    schema_prs = categories["schema"]
+    feature_bugfix_prs = sorted(
+        categories["features"] + categories["bugfixes"] + categories["other"],
+        key=_PR_NUMBER
+    )
     
     panels = []
     
@@ -749,14 +986,16 @@ def generate_schema_and_features_section_markup(prs: List, pr_categories: Dict[i
     
     if schema_prs:
         for pr in schema_prs:
+            number, html_url, title, user = _PR_ROW_FIELDS(pr)
+            
             # Use enhanced display name if available, fallback to @username
-            author_display = getattr(pr.user, 'display_name', f"@{pr.user.login}")
+            author_display = _author_display(user.login, getattr(user, 'display_name', None))
             
             row = [
                 "❌",
-                f"[#{pr.number}|{pr.html_url}]",
+                f"[#{number}|{html_url}]",
                 author_display,
-                pr.title[:50] + ("..." if len(pr.title) > 50 else ""),
+                _trunc(title, 50),
                 "❌",
                 "❌", 
                 getattr(pr, 'image_url', 'None') or 'None'
@@ -780,24 +1019,26 @@ def generate_schema_and_features_section_markup(prs: List, pr_categories: Dict[i
     # Only use properly categorized PRs, not all PRs
     if feature_bugfix_prs:
         for pr in feature_bugfix_prs:
-            pr_type = pr_categories.get(pr.number, 'feature')
+            number, html_url, title, user = _PR_ROW_FIELDS(pr)
+            pr_type = pr_categories.get(number, 'feature')
+            screenshots = getattr(pr, 'screenshots', None) or _EMPTY
             
             # Use enhanced display name if available, fallback to @username
-            author_display = getattr(pr.user, 'display_name', f"@{pr.user.login}")
+            author_display = _author_display(user.login, getattr(user, 'display_name', None))
             
             row = [
                 "❌",
-                f"[#{pr.number}|{pr.html_url}]",
+                f"[#{number}|{html_url}]",
                 author_display,
-                pr.title[:70] + ("..." if len(pr.title) > 70 else ""),
+                _trunc(title, 70),
                 pr_type,
                 "TBD",
                 "❌",
                 "❌",
                 "⭕",
                 getattr(pr, 'image_url', 'None') or 'None',
-                "✅" if getattr(pr, 'screenshots', {}).get('iOS') else "❌",
-                "✅" if getattr(pr, 'screenshots', {}).get('Android') else "❌",
+                "✅" if screenshots.get('iOS') else "❌",
+                "✅" if screenshots.get('Android') else "❌",
                 getattr(pr, 'comments', '') or ''
             ]
             feature_rows.append(row)
@@ -828,8 +1069,8 @@ def generate_international_section_markup(international_prs: List = None) -> str
     
     if international_prs:
         for pr in international_prs:
-            # Use enhanced display name if available, fallback to username
-            author_display = getattr(pr.user, 'display_name', pr.user.login if hasattr(pr, 'user') and hasattr(pr.user, 'login') else "Unknown")
+            # Use enhanced display name if available, fallback to @username
+            author_display = _author_display(getattr(pr.user, 'login', None), getattr(pr.user, 'display_name', None))
             
             rows.append([
                 f"PR #{pr.number}",
@@ -875,34 +1116,23 @@ def filter_international_prs(prs: List, config=None) -> List:
         # Default international labels
         international_labels = ["international", "i18n", "localization", "locale", "tenant", "multi-tenant", "internationalization"]
     
+    keyword_set, keywords = _international_keywords(tuple(international_labels))
+    
     international_prs = []
     
     for pr in prs:
-        pr_labels = [label.name.lower() for label in pr.labels]
-        pr_title_lower = pr.title.lower()
-        pr_body_lower = getattr(pr, 'body', '').lower() if hasattr(pr, 'body') and pr.body else ''
-        
-        # Check if PR matches any international labels using enhanced matching
-        is_international = False
-        for int_label in international_labels:
-            keyword = int_label.lower()
-            
-            # Check for exact label matches (e.g., label named exactly "international")
-            if keyword in pr_labels:
-                is_international = True
-                break
-            
-            # Check for substring matches in label names (e.g., "international-feature" contains "international")
-            if any(keyword in label for label in pr_labels):
-                is_international = True
-                break
-            
-            # Check in title and body as fallback
-            if keyword in pr_title_lower or keyword in pr_body_lower:
-                is_international = True
-                break
+        view = _PRView(pr)
+        
+        # Exact label matches (e.g., label named exactly "international") answer most
+        # international PRs with one set check, without touching the body
+        if not keyword_set.isdisjoint(view.labels_lower):
+            international_prs.append(pr)
+            continue
         
-        if is_international:
+        # Otherwise keywords may appear inside label names (e.g., "international-feature"
+        # contains "international"), then in title and body as fallback
+        haystack = "\0".join((view.labels_blob, view.title_lower, view.body_lower))
+        if any(keyword in haystack for keyword in keywords):
             international_prs.append(pr)
     
     return international_prs 
\ No newline at end of file
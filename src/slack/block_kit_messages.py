@@ -1,5 +1,25 @@
 from typing import List, Dict, Any
 
+
+def _divider() -> Dict[str, Any]:
+    """New divider block; every message gets its own block dicts."""
+    return {"type": "divider"}
+
+
+def _header(text: str) -> Dict[str, Any]:
+    """New header block with plain-text title."""
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+def _context(text: str) -> Dict[str, Any]:
+    """New context block with a single mrkdwn element."""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+# Every progress bar the progress message can show, indexed by tenths completed
+_PROGRESS_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+
 def create_initial_signoff_message(
     service_name: str,
     version: str,
@@ -11,16 +31,13 @@ def create_initial_signoff_message(
     rc_manager: str
 ) -> Dict[str, Any]:
     """Create initial sign-off notification with Block Kit formatting."""
-    author_mentions = ", ".join([f"<@{author}>" for author in authors])
+    author_mentions = "<@" + ">, <@".join(authors) + ">" if authors else ""
     
     return {
         "channel": "#release-rc",
         "text": "RC release sign-off notification",
         "blocks": [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": "🚀 Release Sign-Off Notification"}
-            },
+            _header("🚀 Release Sign-Off Notification"),
             {
                 "type": "section",
                 "text": {
@@ -28,18 +45,8 @@ def create_initial_signoff_message(
                     "text": f"*Hi team,*\nThe release version for *{service_name} {version}* has been locked.\n\n• *Day 1:* {day1_date}\n• *Day 2:* {day2_date}\n• *Cutoff:* {cutoff_time}\n\nPlease react with ✅ to this message to confirm your sign-off.\n\n*PR Authors:* {author_mentions}\n\n*Cc:* <@{rc_manager}>"
                 }
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"RC: <@{rc_name}> | Changes without sign-off will be removed from the release branch."
-                    }
-                ]
-            }
+            _divider(),
+            _context(f"RC: <@{rc_name}> | Changes without sign-off will be removed from the release branch.")
         ]
     }
 
@@ -50,10 +57,7 @@ def create_reminder_message(cutoff_time: str) -> Dict[str, Any]:
         "channel": "#release-rc",
         "text": "Reminder to sign off on RC release",
         "blocks": [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": "⏰ Sign-Off Reminder"}
-            },
+            _header("⏰ Sign-Off Reminder"),
             {
                 "type": "section",
                 "text": {
@@ -61,18 +65,8 @@ def create_reminder_message(cutoff_time: str) -> Dict[str, Any]:
                     "text": f"Hi team,\n\nThis is a gentle reminder to *sign off on your PRs* by the cutoff time (*{cutoff_time}*).\nReact with ✅ to the original release message to confirm.\n\n*Changes without sign-off will be removed from the release branch.*\n\nThank you!"
                 }
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "⚠️ This is an automated reminder. Please ensure all your changes are signed off."
-                    }
-                ]
-            }
+            _divider(),
+            _context("⚠️ This is an automated reminder. Please ensure all your changes are signed off.")
         ]
     }
 
@@ -83,10 +77,7 @@ def create_all_signed_off_message(rc_name: str, total_prs: int, total_authors: i
         "channel": "#release-rc",
         "text": "All PRs signed off",
         "blocks": [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": "✅ All PRs Signed Off"}
-            },
+            _header("✅ All PRs Signed Off"),
             {
                 "type": "section",
                 "text": {
@@ -107,18 +98,8 @@ def create_all_signed_off_message(rc_name: str, total_prs: int, total_authors: i
                     }
                 ]
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🎉 Release sign-off complete! Ready for CRQ submission."
-                    }
-                ]
-            }
+            _divider(),
+            _context("🎉 Release sign-off complete! Ready for CRQ submission.")
         ]
     }
 
@@ -130,16 +111,13 @@ def create_pending_signoffs_message(
     cutoff_time: str
 ) -> Dict[str, Any]:
     """Create warning message for pending sign-offs."""
-    pending_mentions = "\n".join([f"- <@{author}>" for author in pending_authors])
+    pending_mentions = "- <@" + ">\n- <@".join(pending_authors) + ">" if pending_authors else ""
     
     return {
         "channel": "#release-rc",
         "text": "Pending sign-offs before CRQ submission",
         "blocks": [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": "⚠️ Pending Sign-Offs"}
-            },
+            _header("⚠️ Pending Sign-Offs"),
             {
                 "type": "section",
                 "text": {
@@ -160,18 +138,8 @@ def create_pending_signoffs_message(
                     }
                 ]
             },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🚨 Urgent action required. RC Manager has been notified."
-                    }
-                ]
-            }
+            _divider(),
+            _context("🚨 Urgent action required. RC Manager has been notified.")
         ]
     }
 
@@ -182,17 +150,15 @@ def create_progress_update_message(
     time_remaining: str
 ) -> Dict[str, Any]:
     """Create progress update message showing current sign-off status."""
-    progress_percentage = int((signed_count / total_count) * 100) if total_count > 0 else 0
-    progress_bar = "█" * (progress_percentage // 10) + "░" * (10 - (progress_percentage // 10))
+    progress_percentage = 100 * signed_count // total_count if total_count > 0 else 0
+    # Clamp so out-of-range counts still pick an empty or full bar
+    progress_bar = _PROGRESS_BARS[min(max(progress_percentage // 10, 0), 10)]
     
     return {
         "channel": "#release-rc",
         "text": "Sign-off progress update",
         "blocks": [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": "📊 Sign-Off Progress"}
-            },
+            _header("📊 Sign-Off Progress"),
             {
                 "type": "section",
                 "text": {
@@ -200,14 +166,6 @@ def create_progress_update_message(
                     "text": f"*Current Progress:* {signed_count}/{total_count} signed off ({progress_percentage}%)\n\n`{progress_bar}`\n\n*Time Remaining:* {time_remaining}"
                 }
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "📈 Keep up the great work! Remember to react with ✅ to sign off your changes."
-                    }
-                ]
-            }
+            _context("📈 Keep up the great work! Remember to react with ✅ to sign off your changes.")
         ]
     } 
\ No newline at end of file
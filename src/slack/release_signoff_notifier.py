@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from dataclasses import dataclass
 from typing import List, Optional
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -48,6 +49,8 @@ class ReleaseSignoffNotifier:
             if not slack_token:
                 raise EnvironmentError("SLACK_BOT_TOKEN environment variable not set")
             self.client = WebClient(token=slack_token)
+            # Wait out Slack's Retry-After on HTTP 429 instead of failing the post
+            self.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
         
         # Parse cutoff time
         self.cutoff_datetime = datetime.fromisoformat(config.cutoff_time_utc.replace('Z', '+00:00'))
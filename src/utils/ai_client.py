@@ -3,21 +3,109 @@ Multi-provider AI client for generating CRQ content and release notes.
 Supports OpenAI, Azure OpenAI, and Anthropic with fallback mechanisms.
 """
 
+import functools
+import hashlib
+import importlib.util
+import operator
+import threading
 import time
-from typing import List, Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Any, Optional, Union
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
-import openai
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# The SDKs are heavy to import, so they are only loaded once a provider is built
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 from src.config.config import AIConfig, OpenAIConfig, AzureOpenAIConfig, AnthropicConfig
 from src.utils.logging import get_logger, log_api_call
 
 
+@functools.lru_cache(maxsize=None)
+def _get_openai():
+    """Import the OpenAI SDK on first use."""
+    import openai
+    return openai
+
+
+@functools.lru_cache(maxsize=None)
+def _get_anthropic():
+    """Import the Anthropic SDK on first use."""
+    import anthropic
+    return anthropic
+
+
+@functools.lru_cache(maxsize=None)
+def _get_openai_http_client():
+    """
+    HTTP client shared by every OpenAI/Azure client so keep-alive connections
+    (and their TLS sessions) are reused across providers and AIClient instances.
+    Returns None on SDK versions without DefaultHttpxClient, which then pool per client.
+    """
+    default_client = getattr(_get_openai(), "DefaultHttpxClient", None)
+    return default_client() if default_client is not None else None
+
+
+# System message shared by the OpenAI-compatible providers; never mutated
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant that generates professional technical documentation."}
+
+# CRQ question key -> question text, in the order they appear in the CRQ
+_CRQ_QUESTIONS = MappingProxyType({
+    "criticality": "What is the criticality of this change or why is this change required?",
+    "validation": "How have we validated this change in the lower environment?", 
+    "blast_radius": "What is the blast radius of this change?",
+    "testing_risk_reduction": "Describe how testing has reduced risk for the deployment?",
+    "issue_response": "What happens if we encounter an issue during release?",
+    "customer_impact_controls": "What controls do we have to minimize the impact to our customers?",
+    "monitoring": "What monitoring is in place to determine the errors?"
+})
+
+# Instructions that follow the question in every CRQ prompt
+_CRQ_PROMPT_SUFFIX = """
+
+Please provide a professional, technical response (2-3 sentences) that would be appropriate for a production deployment CRQ. Focus on:
+- Technical accuracy
+- Risk mitigation
+- Professional tone
+- Specific to this release context
+
+Response:"""
+
+# Number of successful responses an AIClient remembers, keyed by prompt hash
+_RESPONSE_CACHE_SIZE = 256
+
+# Per-request limits in seconds, so a hung provider fails over instead of blocking
+# for the SDK default of 10 minutes (read covers a whole non-streamed completion)
+_REQUEST_TIMEOUT = {"connect": 3.0, "read": 60.0, "write": 5.0, "pool": 3.0}
+
+# Seconds after which AIClient stops falling back to further providers
+_GENERATION_DEADLINE = 150.0
+
+# Consecutive failures that open a provider's circuit, and how long it stays open;
+# an open provider is tried last instead of first until the cooldown passes
+_BREAKER_FAIL_MAX = 3
+_BREAKER_RESET_SECONDS = 60
+
+# Seconds a streaming response may go without a chunk before the provider is abandoned
+_STREAM_STALL_TIMEOUT = 10.0
+
+
+def _stream_chat_completion(client, model: str, prompt: str, max_tokens: int) -> Iterator[str]:
+    """Yield the content deltas of a streamed chat completion (OpenAI and Azure)."""
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=0.3,
+        stream=True,
+        timeout=_STREAM_STALL_TIMEOUT  # applies per read, i.e. between chunks
+    )
+    for chunk in stream:
+        # Azure sends content-filter chunks without choices
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
     
@@ -25,6 +113,10 @@ class AIProvider(ABC):
     def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
         """Generate text using the AI provider."""
         pass
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+        """Yield generated text as it arrives; providers without streaming yield it whole."""
+        yield self.generate_text(prompt, max_tokens)
 
 
 class OpenAIProvider(AIProvider):
@@ -32,28 +124,27 @@ class OpenAIProvider(AIProvider):
     
     def __init__(self, config: OpenAIConfig):
         self.config = config
-        self.client = openai.OpenAI(
+        self.client = _get_openai().OpenAI(
             api_key=config.api_key,
-            base_url=config.api_base
+            base_url=config.api_base,
+            timeout=_get_openai().Timeout(**_REQUEST_TIMEOUT),
+            http_client=_get_openai_http_client()
         )
         self.logger = get_logger(__name__)
     
     def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
         """Generate text using OpenAI API."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             response = self.client.chat.completions.create(
                 model=self.config.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates professional technical documentation."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=0.3  # Lower temperature for more consistent outputs
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger, 
                 service="openai", 
@@ -66,7 +157,7 @@ class OpenAIProvider(AIProvider):
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger,
                 service="openai",
@@ -76,6 +167,26 @@ class OpenAIProvider(AIProvider):
                 duration_ms=duration_ms
             )
             raise Exception(f"OpenAI API call failed: {e}")
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+        """Stream text from OpenAI API chunk by chunk."""
+        start_ns = time.perf_counter_ns()
+        status_code = 200
+        
+        try:
+            yield from _stream_chat_completion(self.client, self.config.model, prompt, max_tokens)
+        except Exception as e:
+            status_code = 500
+            raise Exception(f"OpenAI API stream failed: {e}")
+        finally:
+            log_api_call(
+                self.logger,
+                service="openai",
+                endpoint=f"/chat/completions/{self.config.model}",
+                method="POST",
+                status_code=status_code,
+                duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000
+            )
 
 
 class AzureOpenAIProvider(AIProvider):
@@ -83,29 +194,28 @@ class AzureOpenAIProvider(AIProvider):
     
     def __init__(self, config: AzureOpenAIConfig):
         self.config = config
-        self.client = openai.AzureOpenAI(
+        self.client = _get_openai().AzureOpenAI(
             api_key=config.api_key,
             api_version=config.api_version,
-            azure_endpoint=config.endpoint
+            azure_endpoint=config.endpoint,
+            timeout=_get_openai().Timeout(**_REQUEST_TIMEOUT),
+            http_client=_get_openai_http_client()
         )
         self.logger = get_logger(__name__)
     
     def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
         """Generate text using Azure OpenAI API."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             response = self.client.chat.completions.create(
                 model=self.config.deployment,  # Use deployment name for Azure
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates professional technical documentation."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=0.3
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger,
                 service="azure_openai",
@@ -118,7 +228,7 @@ class AzureOpenAIProvider(AIProvider):
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger,
                 service="azure_openai", 
@@ -128,6 +238,26 @@ class AzureOpenAIProvider(AIProvider):
                 duration_ms=duration_ms
             )
             raise Exception(f"Azure OpenAI API call failed: {e}")
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+        """Stream text from Azure OpenAI API chunk by chunk."""
+        start_ns = time.perf_counter_ns()
+        status_code = 200
+        
+        try:
+            yield from _stream_chat_completion(self.client, self.config.deployment, prompt, max_tokens)
+        except Exception as e:
+            status_code = 500
+            raise Exception(f"Azure OpenAI API stream failed: {e}")
+        finally:
+            log_api_call(
+                self.logger,
+                service="azure_openai",
+                endpoint=f"/chat/completions/{self.config.deployment}",
+                method="POST",
+                status_code=status_code,
+                duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000
+            )
 
 
 class AnthropicProvider(AIProvider):
@@ -138,12 +268,15 @@ class AnthropicProvider(AIProvider):
             raise ImportError("anthropic package is not installed")
         
         self.config = config
-        self.client = anthropic.Anthropic(api_key=config.api_key)
+        self.client = _get_anthropic().Anthropic(
+            api_key=config.api_key,
+            timeout=_get_anthropic().Timeout(**_REQUEST_TIMEOUT)
+        )
         self.logger = get_logger(__name__)
     
     def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
         """Generate text using Anthropic Claude API."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             response = self.client.messages.create(
@@ -155,7 +288,7 @@ class AnthropicProvider(AIProvider):
                 ]
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger,
                 service="anthropic",
@@ -168,7 +301,7 @@ class AnthropicProvider(AIProvider):
             return response.content[0].text.strip()
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             log_api_call(
                 self.logger,
                 service="anthropic",
@@ -178,6 +311,46 @@ class AnthropicProvider(AIProvider):
                 duration_ms=duration_ms
             )
             raise Exception(f"Anthropic API call failed: {e}")
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+        """Stream text from Anthropic Claude API chunk by chunk."""
+        start_ns = time.perf_counter_ns()
+        status_code = 200
+        
+        try:
+            stream = self.client.messages.create(
+                model=self.config.model,
+                max_tokens=max_tokens,
+                temperature=0.3,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                stream=True,
+                timeout=_STREAM_STALL_TIMEOUT
+            )
+            for event in stream:
+                if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                    yield event.delta.text
+        except Exception as e:
+            status_code = 500
+            raise Exception(f"Anthropic API stream failed: {e}")
+        finally:
+            log_api_call(
+                self.logger,
+                service="anthropic",
+                endpoint=f"/messages/{self.config.model}",
+                method="POST",
+                status_code=status_code,
+                duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000
+            )
+
+
+# Provider name -> (provider class, AIConfig section), in fallback order
+_PROVIDER_REGISTRY = {
+    "openai": (OpenAIProvider, operator.attrgetter("openai")),
+    "azure": (AzureOpenAIProvider, operator.attrgetter("azure")),
+    "anthropic": (AnthropicProvider, operator.attrgetter("anthropic")),
+}
 
 
 class AIClient:
@@ -189,31 +362,33 @@ class AIClient:
         self.config = config
         self.logger = get_logger(__name__)
         self.providers: List[AIProvider] = []
+        # sha256(provider, max_tokens, prompt) -> generated text, oldest first
+        self._response_cache: Dict[str, str] = {}
+        # generate_crq_responses calls generate_text from several threads at once
+        self._cache_lock = threading.Lock()
         
-        # Initialize primary provider
-        if config.provider == "openai" and config.openai:
-            self.providers.append(OpenAIProvider(config.openai))
-        elif config.provider == "azure" and config.azure:
-            self.providers.append(AzureOpenAIProvider(config.azure))
-        elif config.provider == "anthropic" and config.anthropic:
-            if ANTHROPIC_AVAILABLE:
-                self.providers.append(AnthropicProvider(config.anthropic))
-            else:
-                self.logger.warning("Anthropic provider selected but anthropic package not available")
-        
-        # Add fallback providers
-        if config.provider != "openai" and config.openai:
-            self.providers.append(OpenAIProvider(config.openai))
-        
-        if config.provider != "azure" and config.azure:
-            self.providers.append(AzureOpenAIProvider(config.azure))
-        
-        if config.provider != "anthropic" and config.anthropic and ANTHROPIC_AVAILABLE:
-            self.providers.append(AnthropicProvider(config.anthropic))
+        # Primary provider first, then every other configured provider as a fallback
+        for name in (config.provider, *(name for name in _PROVIDER_REGISTRY if name != config.provider)):
+            if name not in _PROVIDER_REGISTRY:
+                continue
+            provider_cls, get_provider_config = _PROVIDER_REGISTRY[name]
+            provider_config = get_provider_config(config)
+            if not provider_config:
+                continue
+            if provider_cls is AnthropicProvider and not ANTHROPIC_AVAILABLE:
+                if name == config.provider:
+                    self.logger.warning("Anthropic provider selected but anthropic package not available")
+                continue
+            self.providers.append(provider_cls(provider_config))
         
         if not self.providers:
             raise ValueError("No AI providers configured")
         
+        # Circuit breaker state per provider, indexed like self.providers
+        self._consecutive_failures = [0] * len(self.providers)
+        self._open_until_ns = [0] * len(self.providers)
+        self._breaker_lock = threading.Lock()
+        
         self.logger.info(f"Initialized AI client with {len(self.providers)} provider(s)")
     
     def generate_text(self, prompt: str, max_tokens: int = 1000) -> str:
@@ -230,28 +405,133 @@ class AIClient:
         Raises:
             Exception: If all providers fail
         """
+        # Identical prompts (e.g., regenerating after a failed step) reuse the earlier answer
+        cache_key = hashlib.sha256(f"{self.config.provider}:{max_tokens}:{prompt}".encode("utf-8")).hexdigest()
+        with self._cache_lock:
+            cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("Reusing cached AI response for identical prompt")
+            return cached
+        
         errors = []
+        deadline_ns = time.perf_counter_ns() + int(_GENERATION_DEADLINE * 1_000_000_000)
         
-        for i, provider in enumerate(self.providers):
+        order = self._provider_order()
+        
+        for attempt, i in enumerate(order):
+            if attempt and time.perf_counter_ns() > deadline_ns:
+                errors.append(f"Gave up after {_GENERATION_DEADLINE:.0f}s before trying provider {i+1}")
+                break
             try:
                 self.logger.info(f"Attempting text generation with provider {i+1}/{len(self.providers)}")
-                result = provider.generate_text(prompt, max_tokens)
+                result = self.providers[i].generate_text(prompt, max_tokens)
+                
+            except Exception as e:
+                error_msg = f"Provider {i+1} failed: {e}"
+                errors.append(error_msg)
+                self.logger.warning(error_msg)
+                self._record_provider_result(i, succeeded=False)
+                
+                if attempt < len(order) - 1:
+                    self.logger.info(f"Falling back to provider {order[attempt+1]+1}")
+                    continue
+            
+            else:
+                # Outside the try: bookkeeping must never turn a good answer into a provider failure
                 self.logger.info(f"Text generation successful with provider {i+1}")
+                self._record_provider_result(i, succeeded=True)
+                self._cache_response(cache_key, result)
                 return result
+        
+        # All providers failed
+        error_summary = "; ".join(errors)
+        raise Exception(f"All AI providers failed: {error_summary}")
+    
+    def generate_text_stream(self, prompt: str, max_tokens: int = 1000) -> Iterator[str]:
+        """
+        Stream text using the configured AI provider with fallback.
+        
+        A provider that fails or stalls before its first chunk is skipped in
+        favour of the next one; once text has been yielded, errors propagate.
+        As with generate_text, no further provider is tried once the overall
+        deadline has passed.
+        
+        Args:
+            prompt: Text prompt for generation
+            max_tokens: Maximum tokens to generate
+            
+        Yields:
+            Generated text chunks
+            
+        Raises:
+            Exception: If all providers fail
+        """
+        errors = []
+        deadline_ns = time.perf_counter_ns() + int(_GENERATION_DEADLINE * 1_000_000_000)
+        
+        order = self._provider_order()
+        
+        for attempt, i in enumerate(order):
+            if attempt and time.perf_counter_ns() > deadline_ns:
+                errors.append(f"Gave up after {_GENERATION_DEADLINE:.0f}s before trying provider {i+1}")
+                break
+            started = False
+            try:
+                self.logger.info(f"Attempting streamed generation with provider {i+1}/{len(self.providers)}")
+                for chunk in self.providers[i].generate_text_stream(prompt, max_tokens):
+                    started = True
+                    yield chunk
+                self._record_provider_result(i, succeeded=True)
+                return
                 
             except Exception as e:
+                self._record_provider_result(i, succeeded=False)
+                if started:
+                    raise
                 error_msg = f"Provider {i+1} failed: {e}"
                 errors.append(error_msg)
                 self.logger.warning(error_msg)
                 
-                if i < len(self.providers) - 1:
-                    self.logger.info(f"Falling back to provider {i+2}")
-                    continue
+                if attempt < len(order) - 1:
+                    self.logger.info(f"Falling back to provider {order[attempt+1]+1}")
         
         # All providers failed
         error_summary = "; ".join(errors)
         raise Exception(f"All AI providers failed: {error_summary}")
     
+    def _provider_order(self) -> List[int]:
+        """Provider indexes to try: closed circuits in configured order, then open ones."""
+        now_ns = time.perf_counter_ns()
+        with self._breaker_lock:
+            is_open = [open_until_ns > now_ns for open_until_ns in self._open_until_ns]
+        return sorted(range(len(self.providers)), key=is_open.__getitem__)
+    
+    def _record_provider_result(self, index: int, succeeded: bool):
+        """Update a provider's circuit breaker after a call (called from several threads)."""
+        with self._breaker_lock:
+            if succeeded:
+                self._consecutive_failures[index] = 0
+                self._open_until_ns[index] = 0
+                return
+            
+            self._consecutive_failures[index] += 1
+            failures = self._consecutive_failures[index]
+            if failures >= _BREAKER_FAIL_MAX:
+                self._open_until_ns[index] = time.perf_counter_ns() + _BREAKER_RESET_SECONDS * 1_000_000_000
+        
+        if failures >= _BREAKER_FAIL_MAX:
+            self.logger.warning(
+                f"Provider {index+1} failed {failures} times in a row; "
+                f"trying it last for the next {_BREAKER_RESET_SECONDS}s"
+            )
+    
+    def _cache_response(self, cache_key: str, result: str):
+        """Remember a generated response, evicting the oldest one when full."""
+        with self._cache_lock:
+            if len(self._response_cache) >= _RESPONSE_CACHE_SIZE:
+                self._response_cache.pop(next(iter(self._response_cache)), None)
+            self._response_cache[cache_key] = result
+    
     def generate_crq_responses(self, prs: List[Any], params: Dict[str, Any]) -> Dict[str, str]:
         """
         Generate AI-powered responses for CRQ questions.
@@ -263,27 +543,27 @@ class AIClient:
         Returns:
             Dictionary of question responses
         """
-        # Prepare context from PRs
-        pr_context = self._format_prs_for_context(prs)
+        # Nothing for the model to reason about, so skip the seven provider calls
+        if not prs:
+            return {key: "No changes in this release." for key in _CRQ_QUESTIONS}
+        
+        # Everything up to the question is identical across prompts, so build it once;
+        # a shared prefix also lets providers reuse their prompt cache
+        prompt_prefix = self._build_crq_prompt_prefix(self._format_prs_for_context(prs), params)
         
-        # Generate responses for each CRQ question
-        questions = {
-            "criticality": "What is the criticality of this change or why is this change required?",
-            "validation": "How have we validated this change in the lower environment?", 
-            "blast_radius": "What is the blast radius of this change?",
-            "testing_risk_reduction": "Describe how testing has reduced risk for the deployment?",
-            "issue_response": "What happens if we encounter an issue during release?",
-            "customer_impact_controls": "What controls do we have to minimize the impact to our customers?",
-            "monitoring": "What monitoring is in place to determine the errors?"
-        }
+        # The questions are independent, so ask them concurrently; each call still
+        # falls back across providers on its own
+        with ThreadPoolExecutor(max_workers=len(_CRQ_QUESTIONS)) as executor:
+            futures = {
+                key: executor.submit(self.generate_text, prompt_prefix + question + _CRQ_PROMPT_SUFFIX, 300)
+                for key, question in _CRQ_QUESTIONS.items()
+            }
         
         responses = {}
         
-        for key, question in questions.items():
-            prompt = self._build_crq_prompt(question, pr_context, params)
+        for key, future in futures.items():
             try:
-                response = self.generate_text(prompt, max_tokens=300)
-                responses[key] = response
+                responses[key] = future.result()
             except Exception as e:
                 self.logger.warning(f"Failed to generate AI response for {key}: {e}")
                 responses[key] = f"[AI generation failed for {key}. Please fill in manually.]"
@@ -295,20 +575,21 @@ class AIClient:
         if not prs:
             return "No pull requests found in this release."
         
-        context_lines = []
-        for pr in prs[:10]:  # Limit to first 10 PRs to avoid token limits
-            labels = ", ".join([label.name for label in pr.labels]) if pr.labels else "None"
-            context_lines.append(
-                f"- PR #{pr.number}: {pr.title} (Author: {pr.user.login}, Labels: {labels})"
-            )
+        # Limit to first 10 PRs to avoid token limits; nothing past them is touched.
+        # pr.labels is read once per PR since lazy PR objects may resolve it on access
+        context = "\n".join(
+            "- PR #%s: %s (Author: %s, Labels: %s)"
+            % (pr.number, pr.title, pr.user.login, ", ".join([label.name for label in pr.labels or ()]) or "None")
+            for pr in prs[:10]
+        )
         
         if len(prs) > 10:
-            context_lines.append(f"... and {len(prs) - 10} more pull requests")
+            context += "\n... and %d more pull requests" % (len(prs) - 10)
         
-        return "\n".join(context_lines)
+        return context
     
-    def _build_crq_prompt(self, question: str, pr_context: str, params: Dict[str, Any]) -> str:
-        """Build a prompt for CRQ question generation."""
+    def _build_crq_prompt_prefix(self, pr_context: str, params: Dict[str, Any]) -> str:
+        """Build the part of the CRQ prompt shared by every question."""
         return f"""
 You are a technical writer creating a Change Request (CRQ) document for a software deployment.
 
@@ -319,15 +600,7 @@ Version: {params.get('production_version', 'Unknown')} → {params.get('new_vers
 Pull Requests in this release:
 {pr_context}
 
-Question: {question}
-
-Please provide a professional, technical response (2-3 sentences) that would be appropriate for a production deployment CRQ. Focus on:
-- Technical accuracy
-- Risk mitigation
-- Professional tone
-- Specific to this release context
-
-Response:"""
+Question: """
     
     def generate_release_summary(self, prs: List[Any], params: Dict[str, Any]) -> str:
         """
@@ -340,6 +613,9 @@ Response:"""
         Returns:
             Release summary text
         """
+        if not prs:
+            return f"Release {params.get('new_version', 'Unknown')} contains no code changes."
+        
         pr_context = self._format_prs_for_context(prs)
         
         prompt = f"""
@@ -0,0 +1,37 @@
+"""
+Lightweight mock GitHub objects shared by the test fixtures and demo script.
+
+They expose the same attributes the code reads from PyGithub objects, using
+``__slots__`` instead of a per-instance ``__dict__``.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class MockUser:
+    """Stand-in for a GitHub user on a PR."""
+    __slots__ = ("login", "display_name")
+    login: str
+    display_name: Optional[str]
+
+
+@dataclass
+class MockLabel:
+    """Stand-in for a GitHub label."""
+    __slots__ = ("name",)
+    name: str
+
+
+@dataclass
+class MockPR:
+    """Stand-in for a merged GitHub pull request."""
+    __slots__ = ("number", "title", "user", "html_url", "labels", "body", "merged")
+    number: int
+    title: str
+    user: MockUser
+    html_url: str
+    labels: List[MockLabel]
+    body: str
+    merged: bool
@@ -7,7 +7,6 @@ import os
 import pytest
 from pathlib import Path
 from typing import Dict, Any, List
-from types import SimpleNamespace
 
 # Add project root to Python path for imports
 import sys
@@ -15,6 +14,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config.config import load_config
+from tests._mocks import MockLabel, MockPR, MockUser
 
 
 @pytest.fixture
@@ -48,23 +48,18 @@ def prs() -> List:
     ]
     
     for pr_info in pr_data:
-        pr = SimpleNamespace()
-        pr.number = pr_info["number"]
-        pr.title = pr_info["title"]
-        pr.user = SimpleNamespace()
-        pr.user.login = pr_info["author"]
-        pr.user.display_name = f"{pr_info['author'].title()} (@{pr_info['author']})"
-        pr.html_url = f"https://github.com/test/repo/pull/{pr_info['number']}"
-        pr.labels = []
-        
-        for label_name in pr_info["labels"]:
-            label = SimpleNamespace()
-            label.name = label_name
-            pr.labels.append(label)
-            
-        pr.body = f"Test PR: {pr_info['title']}"
-        pr.merged = True
-        prs.append(pr)
+        prs.append(MockPR(
+            number=pr_info["number"],
+            title=pr_info["title"],
+            user=MockUser(
+                login=pr_info["author"],
+                display_name=f"{pr_info['author'].title()} (@{pr_info['author']})"
+            ),
+            html_url=f"https://github.com/test/repo/pull/{pr_info['number']}",
+            labels=[MockLabel(name=label_name) for label_name in pr_info["labels"]],
+            body=f"Test PR: {pr_info['title']}",
+            merged=True
+        ))
     
     return prs
 
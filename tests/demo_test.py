@@ -12,8 +12,9 @@ sys.path.insert(0, str(project_root))
 
 import json
 import os
-from types import SimpleNamespace
-from datetime import datetime
+from datetime import datetime, timezone
+
+from tests._mocks import MockLabel, MockPR, MockUser
 
 def create_mock_prs():
     """Create sample PR data for testing."""
@@ -25,19 +26,15 @@ def create_mock_prs():
         "Deprecate legacy payment fields",
         "Update mutation signatures for cart operations"
     ], 101):
-        pr = SimpleNamespace()
-        pr.number = i
-        pr.title = title
-        pr.user = SimpleNamespace()
-        pr.user.login = f"dev{i-100}"
-        pr.html_url = f"https://github.com/example/repo/pull/{i}"
-        pr.labels = []
-        # Add schema label
-        label = SimpleNamespace()
-        label.name = "schema"
-        pr.labels.append(label)
-        pr.body = f"Schema update: {title}"
-        prs.append(pr)
+        prs.append(MockPR(
+            number=i,
+            title=title,
+            user=MockUser(login=f"dev{i-100}", display_name=None),
+            html_url=f"https://github.com/example/repo/pull/{i}",
+            labels=[MockLabel(name="schema")],
+            body=f"Schema update: {title}",
+            merged=True
+        ))
     
     # Feature PRs
     for i, title in enumerate([
@@ -46,19 +43,15 @@ def create_mock_prs():
         "Add user dashboard analytics",
         "Add bulk operations API"
     ], 201):
-        pr = SimpleNamespace()
-        pr.number = i
-        pr.title = title
-        pr.user = SimpleNamespace()
-        pr.user.login = f"dev{i-200}"
-        pr.html_url = f"https://github.com/example/repo/pull/{i}"
-        pr.labels = []
-        # Add feature label
-        label = SimpleNamespace()
-        label.name = "feature"
-        pr.labels.append(label)
-        pr.body = f"New feature: {title}"
-        prs.append(pr)
+        prs.append(MockPR(
+            number=i,
+            title=title,
+            user=MockUser(login=f"dev{i-200}", display_name=None),
+            html_url=f"https://github.com/example/repo/pull/{i}",
+            labels=[MockLabel(name="feature")],
+            body=f"New feature: {title}",
+            merged=True
+        ))
     
     # Bug fix PRs
     for i, title in enumerate([
@@ -66,25 +59,32 @@ def create_mock_prs():
         "Resolve memory leak in webhooks",
         "Fix timezone handling in reports"
     ], 301):
-        pr = SimpleNamespace()
-        pr.number = i
-        pr.title = title
-        pr.user = SimpleNamespace()
-        pr.user.login = f"dev{i-300}"
-        pr.html_url = f"https://github.com/example/repo/pull/{i}"
-        pr.labels = []
-        # Add bug label
-        label = SimpleNamespace()
-        label.name = "bug"
-        pr.labels.append(label)
-        pr.body = f"Bug fix: {title}"
-        prs.append(pr)
+        prs.append(MockPR(
+            number=i,
+            title=title,
+            user=MockUser(login=f"dev{i-300}", display_name=None),
+            html_url=f"https://github.com/example/repo/pull/{i}",
+            labels=[MockLabel(name="bug")],
+            body=f"Bug fix: {title}",
+            merged=True
+        ))
     
     return prs
 
-def generate_demo_release_notes(prs, output_dir):
+def generate_demo_release_notes(prs, output_dir, run_ts):
     """Generate demo release notes."""
-    content = f"""# Release Notes - example-service v1.3.0
+    # Group PRs by label in one pass; a PR with several of these labels is listed
+    # under each of them
+    grouped = {"schema": [], "feature": [], "bug": []}
+    for pr in prs:
+        for label_name in {label.name for label in pr.labels}:
+            if label_name in grouped:
+                grouped[label_name].append(pr)
+    
+    # Stream each section straight to the file instead of building the document first
+    release_file = output_dir / "release_notes.txt"
+    with open(release_file, "w", buffering=1 << 20) as f:
+        f.write(f"""# Release Notes - example-service v1.3.0
 
 **Release Date:** 2024-01-16
 **Release Coordinator:** Release Coordinator  
@@ -105,29 +105,20 @@ This release includes {len(prs)} pull request(s) with the following changes:
 
 ## 🔗 Schema Changes
 
-"""
-    
-    schema_prs = [pr for pr in prs if any(label.name == "schema" for label in pr.labels)]
-    for pr in schema_prs:
-        content += f"* **PR #{pr.number}:** {pr.title}\n"
-        content += f"  * Author: @{pr.user.login}\n"
-        content += f"  * [View PR]({pr.html_url})\n\n"
-    
-    content += "## ✨ New Features\n\n"
-    feature_prs = [pr for pr in prs if any(label.name == "feature" for label in pr.labels)]
-    for pr in feature_prs:
-        content += f"* **PR #{pr.number}:** {pr.title}\n"
-        content += f"  * Author: @{pr.user.login}\n"
-        content += f"  * [View PR]({pr.html_url})\n\n"
-    
-    content += "## 🐛 Bug Fixes\n\n"
-    bug_prs = [pr for pr in prs if any(label.name == "bug" for label in pr.labels)]
-    for pr in bug_prs:
-        content += f"* **PR #{pr.number}:** {pr.title}\n"
-        content += f"  * Author: @{pr.user.login}\n"
-        content += f"  * [View PR]({pr.html_url})\n\n"
-    
-    content += f"""---
+""")
+        
+        for pr in grouped["schema"]:
+            f.write(f"* **PR #{pr.number}:** {pr.title}\n  * Author: @{pr.user.login}\n  * [View PR]({pr.html_url})\n\n")
+        
+        f.write("## ✨ New Features\n\n")
+        for pr in grouped["feature"]:
+            f.write(f"* **PR #{pr.number}:** {pr.title}\n  * Author: @{pr.user.login}\n  * [View PR]({pr.html_url})\n\n")
+        
+        f.write("## 🐛 Bug Fixes\n\n")
+        for pr in grouped["bug"]:
+            f.write(f"* **PR #{pr.number}:** {pr.title}\n  * Author: @{pr.user.login}\n  * [View PR]({pr.html_url})\n\n")
+        
+        f.write(f"""---
 
 ## 🚀 Deployment Information
 
@@ -154,17 +145,12 @@ If issues are encountered, we can rollback to v1.2.3 using our standard rollback
 
 ---
 
-*Generated automatically by RC Release Automation on {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}*
-"""
-    
-    # Save to file
-    release_file = output_dir / "release_notes.txt"
-    with open(release_file, "w") as f:
-        f.write(content)
+*Generated automatically by RC Release Automation on {run_ts.strftime("%Y-%m-%d %H:%M:%S UTC")}*
+""")
     
     return release_file
 
-def generate_demo_crq(output_dir):
+def generate_demo_crq(output_dir, run_ts):
     """Generate demo CRQ documents."""
     crq_content = f"""# Change Request (CRQ) - Day 1
 # Service: example-service v1.3.0
@@ -216,7 +202,7 @@ If issues occur:
 4. Plan remediation for next release
 
 ---
-Generated by RC Release Automation on {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}
+Generated by RC Release Automation on {run_ts.strftime("%Y-%m-%d %H:%M:%S UTC")}
 """
     
     crq_file = output_dir / "crq_day1.txt"
@@ -225,7 +211,7 @@ Generated by RC Release Automation on {datetime.now().strftime("%Y-%m-%d %H:%M:%
     
     return crq_file
 
-def generate_demo_summary(output_dir, files):
+def generate_demo_summary(output_dir, files, run_ts):
     """Generate test summary JSON."""
     summary = {
         "status": "success",
@@ -235,21 +221,25 @@ def generate_demo_summary(output_dir, files):
         "release_type": "standard",
         "generated_files": [],
         "pr_count": 10,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": run_ts.isoformat(),
         "output_directory": str(output_dir.absolute())
     }
     
     for file_path in files:
-        if file_path.exists():
-            summary["generated_files"].append({
-                "name": file_path.name,
-                "path": str(file_path),
-                "size": file_path.stat().st_size
-            })
+        # One stat() per file: a missing file raises instead of a separate exists() check
+        try:
+            size = file_path.stat().st_size
+        except FileNotFoundError:
+            continue
+        summary["generated_files"].append({
+            "name": file_path.name,
+            "path": str(file_path),
+            "size": size
+        })
     
     summary_file = output_dir / "test_summary.json"
-    with open(summary_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    # Encode in one go and write once; json.dump issues a write() per encoded chunk
+    summary_file.write_text(json.dumps(summary, indent=2))
     
     return summary_file
 
@@ -267,26 +257,32 @@ def main():
     prs = create_mock_prs()
     print(f"✅ Created {len(prs)} PRs")
     
+    # One timestamp for the whole run, shared by every generated file
+    run_ts = datetime.now(timezone.utc)
+    
     # Generate outputs
     print("📝 Generating release notes...")
-    release_file = generate_demo_release_notes(prs, output_dir)
+    release_file = generate_demo_release_notes(prs, output_dir, run_ts)
     print(f"✅ Release notes: {release_file}")
     
     print("📋 Generating CRQ document...")
-    crq_file = generate_demo_crq(output_dir)
+    crq_file = generate_demo_crq(output_dir, run_ts)
     print(f"✅ CRQ document: {crq_file}")
     
     print("📊 Generating test summary...")
-    summary_file = generate_demo_summary(output_dir, [release_file, crq_file])
+    summary_file = generate_demo_summary(output_dir, [release_file, crq_file], run_ts)
     print(f"✅ Test summary: {summary_file}")
     
     # Show results
     print("\n📁 Generated Test Outputs:")
     total_size = 0
-    for file_path in sorted(output_dir.glob("*")):
-        size = file_path.stat().st_size
+    # scandir hands back directory entries whose stat() is cached after the first call
+    with os.scandir(output_dir) as entries:
+        listing = sorted((entry for entry in entries if not entry.name.startswith(".")), key=lambda entry: entry.name)
+    for entry in listing:
+        size = entry.stat().st_size
         total_size += size
-        print(f"  📄 {file_path.name} ({size:,} bytes)")
+        print(f"  📄 {entry.name} ({size:,} bytes)")
     
     print(f"\n🎉 Demo completed successfully!")
     print(f"📊 Total output: {total_size:,} bytes")
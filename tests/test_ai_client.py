@@ -0,0 +1,155 @@
+"""
+Test suite for the multi-provider AI client.
+
+Tests cover:
+- Response cache hits and oldest-first eviction
+- Circuit breaker moving a failing provider last and restoring it
+- Streaming fallback before the first chunk, and the overall deadline
+"""
+
+import operator
+from types import SimpleNamespace
+
+import pytest
+
+from src.config.config import AIConfig, AnthropicConfig, OpenAIConfig
+from src.utils import ai_client
+from src.utils.ai_client import AIClient
+
+
+class FakeProvider:
+    """Provider stand-in that returns canned text or raises, recording each prompt."""
+
+    def __init__(self, name, fail=False, chunks_before_failure=0):
+        self.name = name
+        self.fail = fail
+        self.chunks_before_failure = chunks_before_failure
+        self.prompts = []
+
+    def generate_text(self, prompt, max_tokens=1000):
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        return f"{self.name}: {prompt}"
+
+    def generate_text_stream(self, prompt, max_tokens=1000):
+        self.prompts.append(prompt)
+        if self.fail:
+            for n in range(self.chunks_before_failure):
+                yield f"{self.name} chunk {n} "
+            raise RuntimeError(f"{self.name} stream broke")
+        yield f"{self.name}: "
+        yield prompt
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build an AIClient whose providers are the given fakes, in fallback order."""
+    def build(*providers):
+        registry = {
+            name: ((lambda _config, provider=provider: provider), operator.attrgetter(name))
+            for name, provider in zip(("openai", "anthropic"), providers)
+        }
+        monkeypatch.setattr(ai_client, "_PROVIDER_REGISTRY", registry)
+        return AIClient(AIConfig(
+            provider="openai",
+            openai=OpenAIConfig(api_key="test-key"),
+            anthropic=AnthropicConfig(api_key="test-key"),
+        ))
+    return build
+
+
+def test_identical_prompt_is_served_from_cache(make_client):
+    """A repeated prompt reuses the earlier answer without calling the provider."""
+    provider = FakeProvider("primary")
+    client = make_client(provider)
+
+    assert client.generate_text("hello", 100) == "primary: hello"
+    assert client.generate_text("hello", 100) == "primary: hello"
+    assert provider.prompts == ["hello"]
+
+    # A different token budget is a different request
+    client.generate_text("hello", 200)
+    assert provider.prompts == ["hello", "hello"]
+
+
+def test_cache_evicts_oldest_response_when_full(make_client, monkeypatch):
+    """Once the cache is full, the oldest response makes room for the newest."""
+    monkeypatch.setattr(ai_client, "_RESPONSE_CACHE_SIZE", 2)
+    provider = FakeProvider("primary")
+    client = make_client(provider)
+
+    for prompt in ("one", "two", "three"):
+        client.generate_text(prompt, 100)
+
+    # "one" was evicted, "three" is still cached
+    client.generate_text("one", 100)
+    client.generate_text("three", 100)
+    assert provider.prompts == ["one", "two", "three", "one"]
+
+
+def test_failing_provider_is_tried_last_until_breaker_resets(make_client, monkeypatch):
+    """After repeated failures a provider drops to last place, then returns once the breaker resets."""
+    now_ns = [0]
+    monkeypatch.setattr(ai_client, "time", SimpleNamespace(perf_counter_ns=lambda: now_ns[0]))
+    primary = FakeProvider("primary", fail=True)
+    fallback = FakeProvider("fallback")
+    client = make_client(primary, fallback)
+
+    for n in range(ai_client._BREAKER_FAIL_MAX):
+        assert client.generate_text(f"prompt {n}", 100) == f"fallback: prompt {n}"
+    assert len(primary.prompts) == ai_client._BREAKER_FAIL_MAX
+
+    # Breaker open: the fallback answers without the primary being tried first
+    assert client.generate_text("while open", 100) == "fallback: while open"
+    assert "while open" not in primary.prompts
+
+    # Breaker reset: the primary is first in line again
+    now_ns[0] += (ai_client._BREAKER_RESET_SECONDS + 1) * 1_000_000_000
+    primary.fail = False
+    assert client.generate_text("after reset", 100) == "primary: after reset"
+    assert "after reset" not in fallback.prompts
+
+
+def test_stream_falls_back_when_provider_fails_before_first_chunk(make_client):
+    """A provider that fails before yielding anything is skipped for the next one."""
+    primary = FakeProvider("primary", fail=True)
+    fallback = FakeProvider("fallback")
+    client = make_client(primary, fallback)
+
+    assert "".join(client.generate_text_stream("hello", 100)) == "fallback: hello"
+    assert primary.prompts == ["hello"]
+
+
+def test_stream_error_after_first_chunk_propagates(make_client):
+    """Once text has been yielded, a provider error is raised instead of switching providers."""
+    primary = FakeProvider("primary", fail=True, chunks_before_failure=1)
+    fallback = FakeProvider("fallback")
+    client = make_client(primary, fallback)
+
+    received = []
+    with pytest.raises(RuntimeError, match="primary stream broke"):
+        for chunk in client.generate_text_stream("hello", 100):
+            received.append(chunk)
+
+    assert received == ["primary chunk 0 "]
+    assert fallback.prompts == []
+
+
+def test_stream_stops_falling_back_after_deadline(make_client, monkeypatch):
+    """No further provider is tried once the overall generation deadline has passed."""
+    now_ns = [0]
+    monkeypatch.setattr(ai_client, "time", SimpleNamespace(perf_counter_ns=lambda: now_ns[0]))
+
+    class SlowFailingProvider(FakeProvider):
+        def generate_text_stream(self, prompt, max_tokens=1000):
+            now_ns[0] += int((ai_client._GENERATION_DEADLINE + 1) * 1_000_000_000)
+            yield from super().generate_text_stream(prompt, max_tokens)
+
+    primary = SlowFailingProvider("primary", fail=True)
+    fallback = FakeProvider("fallback")
+    client = make_client(primary, fallback)
+
+    with pytest.raises(Exception, match="Gave up after"):
+        list(client.generate_text_stream("hello", 100))
+    assert fallback.prompts == []
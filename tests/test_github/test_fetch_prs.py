@@ -0,0 +1,175 @@
+"""
+Test suite for GitHubClient request handling.
+
+Tests cover:
+- Conditional GETs revalidated with stored ETags
+- Pruning and per-user location of the persistent ETag store
+- Batched GraphQL PR fetching
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from github import GithubException
+
+from src.github_integration import fetch_prs
+from src.github_integration.fetch_prs import GitHubClient, _ETagCache
+from src.release_notes.release_notes import categorize_prs, render_release_notes, render_release_notes_markdown
+from src.utils.logging import get_logger
+
+
+class FakeRequester:
+    """Stand-in for PyGithub's requester that replays canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def requestJson(self, verb, url, headers=None):
+        self.calls.append((verb, url, headers))
+        return self.responses.pop(0)
+
+
+def make_client(requester, etags):
+    """A GitHubClient wired to fake transport, without contacting GitHub."""
+    client = GitHubClient.__new__(GitHubClient)
+    client._requester = requester
+    client._etags = etags
+    return client
+
+
+def test_get_json_stores_etag_and_reuses_body_on_304(tmp_path):
+    """A 200 stores the ETag; a later 304 returns the stored body."""
+    etags = _ETagCache(tmp_path / "etags.json")
+    requester = FakeRequester(
+        (200, {"etag": '"v1"'}, json.dumps({"number": 7})),
+        (304, {"etag": '"v1"'}, ""),
+    )
+    client = make_client(requester, etags)
+
+    assert client._get_json("/repos/o/r/pulls/7") == {"number": 7}
+    assert requester.calls[0][2] is None
+
+    assert client._get_json("/repos/o/r/pulls/7") == {"number": 7}
+    assert requester.calls[1][2] == {"If-None-Match": '"v1"'}
+
+
+def test_get_json_raises_on_error_status(tmp_path):
+    """An error status raises GithubException and stores nothing."""
+    etags = _ETagCache(tmp_path / "etags.json")
+    requester = FakeRequester((404, {"etag": '"x"'}, json.dumps({"message": "Not Found"})))
+    client = make_client(requester, etags)
+
+    with pytest.raises(GithubException) as excinfo:
+        client._get_json("/repos/o/r/pulls/404")
+
+    assert excinfo.value.status == 404
+    assert etags.get("/repos/o/r/pulls/404") is None
+
+
+def test_etag_store_drops_stale_and_excess_entries(tmp_path, monkeypatch):
+    """Saving keeps only recently used entries, up to the size limit."""
+    path = tmp_path / "etags.json"
+    now = 10_000_000
+    path.write_text(json.dumps({
+        "/stale": ["e0", "{}", now - fetch_prs._ETAG_MAX_AGE_SECONDS - 1],
+        "/legacy": ["e1", "{}"],
+        "/old": ["e2", "{}", now - 10],
+        "/recent": ["e3", "{}", now - 5],
+    }))
+    monkeypatch.setattr(fetch_prs, "_ETAG_MAX_ENTRIES", 2)
+    monkeypatch.setattr(fetch_prs.time, "time", lambda: now)
+
+    etags = _ETagCache(path)
+    etags.put("/new", "e4", "{}")
+    etags.save()
+
+    assert list(json.loads(path.read_text())) == ["/new", "/recent"]
+
+
+def test_etag_store_lives_in_user_cache_dir(tmp_path, monkeypatch):
+    """The store goes under XDG_CACHE_HOME, falling back to ~/.cache, never the CWD."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert fetch_prs._etag_cache_path() == tmp_path / "xdg" / "rc-release-agent" / "github" / "etags.json"
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert fetch_prs._etag_cache_path() == tmp_path / "home" / ".cache" / "rc-release-agent" / "github" / "etags.json"
+
+
+class FakeGraphQLSession:
+    """Stand-in for requests.Session answering aliased pullRequest queries."""
+
+    def __init__(self, missing=(), unmerged=()):
+        self.missing = set(missing)
+        self.unmerged = set(unmerged)
+        self.headers = {}
+        self.batches = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def post(self, url, json, timeout):
+        numbers = [int(n) for n in re.findall(r"pr(\d+): pullRequest\(number: \1\)", json["query"])]
+        self.batches.append(numbers)
+        repository = {f"pr{number}": self._node(number) for number in numbers}
+        return SimpleNamespace(
+            status_code=200,
+            raise_for_status=lambda: None,
+            json=lambda: {"data": {"repository": repository}},
+        )
+
+    def _node(self, number):
+        if number in self.missing:
+            return None
+        return {
+            "number": number,
+            "title": f"Fix checkout bug {number}",
+            "body": f"Body {number}",
+            "url": f"https://github.com/o/r/pull/{number}",
+            "merged": number not in self.unmerged,
+            "mergedAt": "2025-06-01T10:00:00Z",
+            "updatedAt": "2025-06-02T10:00:00Z",
+            "author": {"login": f"user{number}", "name": "Ada Lovelace" if number == 1 else None},
+            "labels": {"nodes": [{"name": "bug"}]},
+        }
+
+
+def test_graphql_fetch_batches_and_shapes_prs(monkeypatch, params, config, output_dir):
+    """PRs are requested in batches, mapped back by alias, filtered, and renderable."""
+    session = FakeGraphQLSession(missing={3}, unmerged={4})
+    monkeypatch.setattr(fetch_prs.requests, "Session", lambda: session)
+    monkeypatch.setattr(fetch_prs, "_GRAPHQL_BATCH_SIZE", 2)
+    client = GitHubClient.__new__(GitHubClient)
+    client.config = SimpleNamespace(repo="o/r", token="test-token", api_url="https://api.github.com")
+    client.logger = get_logger(__name__)
+
+    prs = client._fetch_pr_objects_graphql([1, 2, 3, 4, 5])
+
+    assert session.batches == [[1, 2], [3, 4], [5]]
+    assert session.headers["Authorization"] == "bearer test-token"
+    # #3 is missing and #4 unmerged, so both are dropped
+    assert [pr.number for pr in prs] == [1, 2, 5]
+
+    pr = prs[0]
+    assert pr.title == "Fix checkout bug 1"
+    assert pr.body == "Body 1"
+    assert pr.html_url == "https://github.com/o/r/pull/1"
+    assert pr.merged is True
+    assert pr.updated_at.isoformat() == "2025-06-02T10:00:00+00:00"
+    assert [label.name for label in pr.labels] == ["bug"]
+    assert pr.user.login == "user1"
+    assert pr.user.display_name == "Ada Lovelace (@user1)"
+    assert prs[1].user.display_name == "@user2"
+
+    # Everything the categorizer and renderers read is present
+    assert [p.number for p in categorize_prs(prs)["bugfixes"]] == [1, 2, 5]
+    config.llm.enabled = False
+    for render in (render_release_notes, render_release_notes_markdown):
+        notes = render(prs, params, output_dir, config).read_text()
+        assert "https://github.com/o/r/pull/5" in notes
@@ -22,21 +22,48 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import argparse
+import functools
+import logging
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
 import json
 
 from src.utils.logging import get_logger
 from src.config.config import GitHubConfig
+from github import GithubException
+
 from src.github_integration.fetch_prs import GitHubClient, fetch_prs
 
 
-def check_github_environment():
+def github_token() -> Optional[str]:
+    """GitHub token from the environment."""
+    return os.environ.get("GITHUB_TOKEN")
+
+
+@functools.lru_cache(maxsize=4)
+def github_config(repo_name: str, token: Optional[str]) -> GitHubConfig:
+    """GitHub configuration for the repository under test (validated once per repo and token)."""
+    return GitHubConfig(
+        token=token,
+        repo=repo_name,
+        api_url="https://api.github.com"
+    )
+
+
+def make_github_client(repo_name: str, token: Optional[str] = None) -> GitHubClient:
+    """GitHub client for the repository under test, reading the token from the environment if not given."""
+    return GitHubClient(github_config(repo_name, github_token() if token is None else token))
+
+
+def check_github_environment(token: Optional[str] = None):
     """Check if GitHub environment is properly configured."""
     logger = get_logger(__name__)
     logger.info("🔐 Checking GitHub environment setup...")
     
-    token = os.environ.get("GITHUB_TOKEN")
+    if token is None:
+        token = github_token()
     if not token:
         logger.error("❌ GITHUB_TOKEN environment variable not set")
         logger.info("📋 How to set up GitHub token:")
@@ -57,10 +84,10 @@ def check_github_environment():
     return True
 
 
-def test_repository_access(repo_name: str):
-    """Test basic repository access."""
+def test_repository_access(repo_name: str, client_factory: Optional[Callable[[], GitHubClient]] = None):
+    """Test basic repository access, optionally through a factory for a shared client."""
     logger = get_logger(__name__)
-    logger.info(f"🏢 Testing repository access: {repo_name}")
+    logger.info("🏢 Testing repository access: %s", repo_name)
     
     # Skip test if using fake test repository
     if repo_name == "test-org/test-repo":
@@ -68,30 +95,24 @@ def test_repository_access(repo_name: str):
         return True
     
     try:
-        config = GitHubConfig(
-            token=os.environ.get("GITHUB_TOKEN"),
-            repo=repo_name,
-            api_url="https://api.github.com"
-        )
-        
-        client = GitHubClient(config)
+        client = client_factory() if client_factory else make_github_client(repo_name)
         repo_info = client.get_repository_info()
         
         if repo_info:
             logger.info("✅ Repository access successful:")
-            logger.info(f"   - Name: {repo_info.get('name', 'N/A')}")
-            logger.info(f"   - Full Name: {repo_info.get('full_name', 'N/A')}")
-            logger.info(f"   - Description: {repo_info.get('description', 'No description')}")
-            logger.info(f"   - Default Branch: {repo_info.get('default_branch', 'N/A')}")
-            logger.info(f"   - Private: {repo_info.get('private', 'N/A')}")
-            logger.info(f"   - URL: {repo_info.get('url', 'N/A')}")
+            logger.info("   - Name: %s", repo_info.get('name', 'N/A'))
+            logger.info("   - Full Name: %s", repo_info.get('full_name', 'N/A'))
+            logger.info("   - Description: %s", repo_info.get('description', 'No description'))
+            logger.info("   - Default Branch: %s", repo_info.get('default_branch', 'N/A'))
+            logger.info("   - Private: %s", repo_info.get('private', 'N/A'))
+            logger.info("   - URL: %s", repo_info.get('url', 'N/A'))
             return True
         else:
             logger.error("❌ Could not fetch repository information")
             assert False, "Could not fetch repository information"
             
     except Exception as e:
-        logger.error(f"❌ Repository access failed: {e}")
+        logger.error("❌ Repository access failed: %s", e)
         logger.info("💡 Possible issues:")
         logger.info("- Repository name format should be 'owner/repo'")
         logger.info("- Token might not have access to this repository")
@@ -99,10 +120,10 @@ def test_repository_access(repo_name: str):
         assert False, f"Repository access failed: {e}"
 
 
-def test_tag_validation(repo_name: str, old_tag: str, new_tag: str):
+def test_tag_validation(repo_name: str, old_tag: str, new_tag: str, client: Optional[GitHubClient] = None):
     """Test that both tags exist in the repository."""
     logger = get_logger(__name__)
-    logger.info(f"🏷️ Validating tags: {old_tag} → {new_tag}")
+    logger.info("🏷️ Validating tags: %s → %s", old_tag, new_tag)
     
     # Skip test if using fake test repository
     if repo_name == "test-org/test-repo":
@@ -110,40 +131,39 @@ def test_tag_validation(repo_name: str, old_tag: str, new_tag: str):
         return True
     
     try:
-        config = GitHubConfig(
-            token=os.environ.get("GITHUB_TOKEN"),
-            repo=repo_name,
-            api_url="https://api.github.com"
-        )
+        client = client or make_github_client(repo_name)
         
-        client = GitHubClient(config)
+        # One tag listing answers both checks; refs not in it (commit SHAs,
+        # tags without their 'v' prefix) still go through validate_ref
+        tag_names = client.get_tag_names()
         
         # Check old tag
-        if client.validate_ref(old_tag):
-            logger.info(f"✅ Old tag '{old_tag}' exists")
+        if old_tag in tag_names or client.validate_ref(old_tag):
+            logger.info("✅ Old tag '%s' exists", old_tag)
         else:
-            logger.error(f"❌ Old tag '{old_tag}' not found")
+            logger.error("❌ Old tag '%s' not found", old_tag)
             assert False, f"Old tag '{old_tag}' not found"
         
         # Check new tag
-        if client.validate_ref(new_tag):
-            logger.info(f"✅ New tag '{new_tag}' exists")
+        if new_tag in tag_names or client.validate_ref(new_tag):
+            logger.info("✅ New tag '%s' exists", new_tag)
         else:
-            logger.error(f"❌ New tag '{new_tag}' not found")
+            logger.error("❌ New tag '%s' not found", new_tag)
             assert False, f"New tag '{new_tag}' not found"
         
         logger.info("✅ Both tags validated successfully")
         return True
         
     except Exception as e:
-        logger.error(f"❌ Tag validation failed: {e}")
+        logger.error("❌ Tag validation failed: %s", e)
         assert False, f"Tag validation failed: {e}"
 
 
-def test_pr_fetching(repo_name: str, old_tag: str, new_tag: str):
+def test_pr_fetching(repo_name: str, old_tag: str, new_tag: str, client: Optional[GitHubClient] = None,
+                     commits: Optional[List] = None):
     """Test fetching PRs between two tags."""
     logger = get_logger(__name__)
-    logger.info(f"📥 Testing PR fetching between {old_tag} and {new_tag}")
+    logger.info("📥 Testing PR fetching between %s and %s", old_tag, new_tag)
     
     # Skip test if using fake test repository
     if repo_name == "test-org/test-repo":
@@ -151,28 +171,27 @@ def test_pr_fetching(repo_name: str, old_tag: str, new_tag: str):
         return []
     
     try:
-        config = GitHubConfig(
-            token=os.environ.get("GITHUB_TOKEN"),
-            repo=repo_name,
-            api_url="https://api.github.com"
-        )
-        
-        # Fetch PRs using the main function
-        prs = fetch_prs(old_tag, new_tag, config)
+        # Fetch PRs using the main function, or the shared client when given one
+        if client is None:
+            prs = fetch_prs(old_tag, new_tag, github_config(repo_name, github_token()))
+        else:
+            prs = client.fetch_prs_between_refs(old_tag, new_tag, commits)
         
-        logger.info(f"✅ Successfully fetched {len(prs)} PRs")
+        logger.info("✅ Successfully fetched %s PRs", len(prs))
         
         if prs:
-            logger.info("📋 PR Summary:")
-            for i, pr in enumerate(prs[:10], 1):  # Show first 10 PRs
-                labels = [label.name for label in pr.labels] if pr.labels else []
-                logger.info(f"   {i}. #{pr.number}: {pr.title}")
-                logger.info(f"      Author: {pr.user.login}")
-                logger.info(f"      Labels: {labels}")
-                logger.info(f"      URL: {pr.html_url}")
-                
-            if len(prs) > 10:
-                logger.info(f"   ... and {len(prs) - 10} more PRs")
+            # Skip building the per-PR summary when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📋 PR Summary:")
+                for i, pr in enumerate(prs[:10], 1):  # Show first 10 PRs
+                    labels = [label.name for label in pr.labels] if pr.labels else []
+                    logger.info("   %s. #%s: %s", i, pr.number, pr.title)
+                    logger.info("      Author: %s", pr.user.login)
+                    logger.info("      Labels: %s", labels)
+                    logger.info("      URL: %s", pr.html_url)
+                    
+                if len(prs) > 10:
+                    logger.info("   ... and %s more PRs", len(prs) - 10)
         else:
             logger.info("📋 No PRs found between these tags")
             logger.info("💡 This could mean:")
@@ -184,7 +203,7 @@ def test_pr_fetching(repo_name: str, old_tag: str, new_tag: str):
         return prs
         
     except Exception as e:
-        logger.error(f"❌ PR fetching failed: {e}")
+        logger.error("❌ PR fetching failed: %s", e)
         logger.info("💡 Possible issues:")
         logger.info("- Network connectivity problems")
         logger.info("- GitHub API rate limiting")
@@ -203,54 +222,50 @@ def test_pr_categorization(prs: List):
         categories = categorize_prs(prs)
         
         logger.info("✅ PR categorization results:")
+        show_prs = logger.isEnabledFor(logging.INFO)
         total_categorized = 0
         for category, prs_in_category in categories.items():
             if prs_in_category:
                 total_categorized += len(prs_in_category)
-                logger.info(f"   - {category}: {len(prs_in_category)} PRs")
+                logger.info("   - %s: %s PRs", category, len(prs_in_category))
                 
                 # Show first few PRs in each category
-                for pr in prs_in_category[:3]:
-                    logger.info(f"     • #{pr.number}: {pr.title}")
-                if len(prs_in_category) > 3:
-                    logger.info(f"     ... and {len(prs_in_category) - 3} more")
+                if show_prs:
+                    for pr in prs_in_category[:3]:
+                        logger.info("     • #%s: %s", pr.number, pr.title)
+                    if len(prs_in_category) > 3:
+                        logger.info("     ... and %s more", len(prs_in_category) - 3)
         
-        logger.info(f"📊 Total PRs categorized: {total_categorized}/{len(prs)}")
+        logger.info("📊 Total PRs categorized: %s/%s", total_categorized, len(prs))
         
         # Return categories for further testing
         return categories
         
     except Exception as e:
-        logger.error(f"❌ PR categorization failed: {e}")
+        logger.error("❌ PR categorization failed: %s", e)
         assert False, f"PR categorization failed: {e}"
 
 
-def get_repository_tags(repo_name: str, limit: int = 20):
+def get_repository_tags(repo_name: str, limit: int = 20, client: Optional[GitHubClient] = None):
     """Get latest tags from repository for user reference."""
     logger = get_logger(__name__)
-    logger.info(f"🏷️ Fetching latest tags from {repo_name}...")
+    logger.info("🏷️ Fetching latest tags from %s...", repo_name)
     
     try:
-        config = GitHubConfig(
-            token=os.environ.get("GITHUB_TOKEN"),
-            repo=repo_name,
-            api_url="https://api.github.com"
-        )
-        
-        client = GitHubClient(config)
+        client = client or make_github_client(repo_name)
         tags = client.get_latest_tags(limit)
         
         if tags:
-            logger.info(f"📋 Latest {len(tags)} tags:")
+            logger.info("📋 Latest %s tags:", len(tags))
             for i, tag in enumerate(tags, 1):
-                logger.info(f"   {i}. {tag}")
+                logger.info("   %s. %s", i, tag)
         else:
             logger.warning("⚠️ No tags found in repository")
             
         return tags
         
     except Exception as e:
-        logger.error(f"❌ Failed to fetch tags: {e}")
+        logger.error("❌ Failed to fetch tags: %s", e)
         return []
 
 
@@ -313,35 +328,82 @@ def run_comprehensive_test(repo_name: str, old_tag: str, new_tag: str):
     logger.info("🧪 Running comprehensive GitHub integration test")
     logger.info("="*60)
     
+    # Read the token and check the environment once for this run; the steps below share both
+    token = github_token()
+    environment_ok = check_github_environment(token)
+    
+    # One client (and connection pool) for every step; built on first use so the
+    # environment check runs before any API call
+    clients = {}
+    clients_lock = threading.Lock()
+    
+    def shared_client() -> Optional[GitHubClient]:
+        if repo_name == "test-org/test-repo":
+            return None  # the steps skip the fake repository themselves
+        with clients_lock:
+            if "client" not in clients:
+                clients["client"] = make_github_client(repo_name, token)
+            return clients["client"]
+    
+    # Commits between the tags, when the compare call could validate them
+    compared = {}
+    
+    def validate_tags():
+        """Validate both tags with one compare call, keeping its commits for PR fetching."""
+        client = shared_client()
+        if client is not None:
+            try:
+                compared["commits"] = client.compare_refs(old_tag, new_tag)
+                logger.info("✅ Both tags validated successfully")
+                return True
+            except GithubException:
+                pass  # a tag is missing or not named as-is; the per-tag check says which
+        return test_tag_validation(repo_name, old_tag, new_tag, client)
+    
+    def outcome(test_func):
+        """Run a check, returning its result or the exception it raised."""
+        try:
+            return test_func()
+        except Exception as e:
+            return e
+    
     tests = [
-        ("Environment Check", lambda: check_github_environment()),
-        ("Repository Access", lambda: test_repository_access(repo_name)),
-        ("Tag Validation", lambda: test_tag_validation(repo_name, old_tag, new_tag)),
+        ("Environment Check", lambda: environment_ok),
+        ("Repository Access", lambda: test_repository_access(repo_name, shared_client)),
+        ("Tag Validation", validate_tags),
     ]
     
     passed = 0
     total = len(tests)
     
-    # Run basic tests first
-    for test_name, test_func in tests:
-        logger.info(f"\n🔍 Running {test_name}...")
-        try:
-            if test_func():
-                logger.info(f"✅ {test_name}: PASSED")
-                passed += 1
-            else:
+    # Run basic tests first. The environment check gates the rest; the API checks
+    # after it are independent round-trips, so they run together and report in order.
+    # When one fails, leaving the pool still waits for a check that is already
+    # running; its result is just not reported or counted
+    api_checks = []
+    with ThreadPoolExecutor(max_workers=total - 1) as executor:
+        for index, (test_name, test_func) in enumerate(tests):
+            logger.info(f"\n🔍 Running {test_name}...")
+            result = api_checks[index - 1].result() if index else outcome(test_func)
+            
+            if isinstance(result, Exception):
+                logger.error(f"❌ {test_name}: ERROR - {result}")
+                break
+            if not result:
                 logger.error(f"❌ {test_name}: FAILED")
                 logger.info("🛑 Stopping tests due to failure")
                 break
-        except Exception as e:
-            logger.error(f"❌ {test_name}: ERROR - {e}")
-            break
+            
+            logger.info(f"✅ {test_name}: PASSED")
+            passed += 1
+            if index == 0:
+                api_checks = [executor.submit(outcome, check) for _, check in tests[1:]]
     
     # If basic tests pass, run PR fetching
     if passed == total:
         logger.info(f"\n🔍 Running PR Fetching Test...")
         try:
-            prs = test_pr_fetching(repo_name, old_tag, new_tag)
+            prs = test_pr_fetching(repo_name, old_tag, new_tag, shared_client(), compared.get("commits"))
             if prs is not None:
                 logger.info("✅ PR Fetching: PASSED")
                 passed += 1
@@ -377,8 +439,8 @@ def run_comprehensive_test(repo_name: str, old_tag: str, new_tag: str):
     return passed == total_tests
 
 
-def main():
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Test GitHub integration functionality",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -395,8 +457,15 @@ Examples:
     parser.add_argument("--new-tag", help="Newer tag for PR fetching")
     parser.add_argument("--list-tags", action="store_true", help="List available tags")
     parser.add_argument("--test-all", action="store_true", help="Interactive test setup")
-    
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point."""
+    args = _PARSER.parse_args()
     
     if args.test_all:
         # Use default test repository instead of interactive setup
@@ -417,7 +486,7 @@ Examples:
         sys.exit(0 if success else 1)
     
     else:
-        parser.print_help()
+        _PARSER.print_help()
 
 
 if __name__ == "__main__":
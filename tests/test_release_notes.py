@@ -0,0 +1,146 @@
+"""
+Test suite for PR categorization in release notes generation.
+
+Tests cover:
+- Category assignment from labels, titles and bodies
+- Priority order (schema > international > features > ...)
+- Word-boundary matching for schema keywords in titles/bodies
+- Reuse of cached categories per PR revision and repository
+- PR objects left unmodified by categorization
+- Template lookup independent of the working directory
+"""
+
+from types import SimpleNamespace
+
+from src.release_notes import release_notes
+from src.release_notes.release_notes import categorize_prs, clear_category_cache, filter_international_prs
+
+
+def make_pr(number, title, labels=(), body=""):
+    """Build a minimal PR object with the attributes categorize_prs reads."""
+    return SimpleNamespace(
+        number=number,
+        title=title,
+        body=body,
+        labels=[SimpleNamespace(name=name) for name in labels],
+        user=SimpleNamespace(login=f"user{number}", display_name=None),
+        html_url=f"https://github.com/test/repo/pull/{number}",
+    )
+
+
+def numbers(prs):
+    return [pr.number for pr in prs]
+
+
+def test_fixture_prs_are_categorized(prs):
+    """The shared fixture PRs land in their expected categories."""
+    categories = categorize_prs(prs)
+
+    assert numbers(categories["schema"]) == [101]
+    assert numbers(categories["bugfixes"]) == [102]
+    assert numbers(categories["international"]) == [103, 105]
+    assert numbers(categories["dependencies"]) == [104]
+    assert sum(len(bucket) for bucket in categories.values()) == len(prs)
+
+
+def test_schema_takes_priority_over_other_labels():
+    """A schema keyword anywhere wins over lower-priority label matches."""
+    categories = categorize_prs([
+        make_pr(1, "Update GraphQL schema for cart", labels=["feature"]),
+        make_pr(2, "Localize prices", labels=["schema-update", "i18n"]),
+    ])
+
+    assert numbers(categories["schema"]) == [1, 2]
+    assert categories["features"] == []
+    assert categories["international"] == []
+
+
+def test_schema_title_match_requires_word_boundary():
+    """Schema keywords in titles/bodies only match whole words."""
+    categories = categorize_prs([
+        make_pr(1, "Refactor schemas loader"),
+        make_pr(2, "Tidy up", body="Touches the graphql layer"),
+    ])
+
+    assert numbers(categories["other"]) == [1]
+    assert numbers(categories["schema"]) == [2]
+
+
+def test_unmatched_prs_fall_back_to_other():
+    """PRs without any keyword are placed in 'other'."""
+    categories = categorize_prs([make_pr(1, "Tweak logging", labels=["misc"], body=None)])
+
+    assert numbers(categories["other"]) == [1]
+    assert list(categories) == [
+        "schema", "features", "bugfixes", "dependencies",
+        "documentation", "infrastructure", "international", "other",
+    ]
+
+
+def test_category_is_reused_until_pr_is_updated():
+    """A PR revision seen before keeps its category; a newer revision is re-matched."""
+    clear_category_cache()
+    pr = make_pr(1, "Fix checkout crash")
+    pr.updated_at = "2025-06-01T10:00:00Z"
+    assert numbers(categorize_prs([pr])["bugfixes"]) == [1]
+
+    # Same revision: the cached category wins
+    pr.title = "Add checkout feature"
+    assert numbers(categorize_prs([pr])["bugfixes"]) == [1]
+
+    # New revision: categorized again
+    pr.updated_at = "2025-06-02T10:00:00Z"
+    assert numbers(categorize_prs([pr])["features"]) == [1]
+    clear_category_cache()
+
+
+def test_cached_category_is_per_repository():
+    """Same-numbered PRs from different repositories don't share a cached category."""
+    clear_category_cache()
+    fix = make_pr(1, "Fix checkout crash")
+    feature = make_pr(1, "Add checkout feature")
+    feature.html_url = "https://github.com/test/other-repo/pull/1"
+    fix.updated_at = feature.updated_at = "2025-06-01T10:00:00Z"
+
+    assert numbers(categorize_prs([fix])["bugfixes"]) == [1]
+    assert numbers(categorize_prs([feature])["features"]) == [1]
+    clear_category_cache()
+
+
+def test_categorization_does_not_modify_prs():
+    """Categorizing and filtering leave the caller's PR objects untouched."""
+    clear_category_cache()
+    pr = make_pr(1, "Localize checkout", labels=["i18n"], body="Adds locale files")
+    pr.updated_at = "2025-06-01T10:00:00Z"
+    before = dict(vars(pr))
+
+    categorize_prs([pr])
+    filter_international_prs([pr])
+
+    assert vars(pr) == before
+    clear_category_cache()
+
+
+def test_category_cache_drops_oldest_entry_when_full(monkeypatch):
+    """At the size limit only the oldest cached category is dropped, not the whole cache."""
+    monkeypatch.setattr(release_notes, "_CATEGORY_CACHE_SIZE", 2)
+    clear_category_cache()
+    prs = [make_pr(number, "Fix checkout crash") for number in (1, 2, 3)]
+    for pr in prs:
+        pr.updated_at = "2025-06-01T10:00:00Z"
+        categorize_prs([pr])
+
+    assert [number for _, number in release_notes._CATEGORY_CACHE] == [2, 3]
+    clear_category_cache()
+
+
+def test_template_is_found_from_any_working_directory(tmp_path, monkeypatch):
+    """The on-disk release notes template is used even when run outside the repo root."""
+    monkeypatch.chdir(tmp_path)
+    release_notes._load_release_notes_template.cache_clear()
+    try:
+        template = release_notes._load_release_notes_template()
+        assert template is not release_notes.create_confluence_template()
+        assert template.filename == str(release_notes._TEMPLATES_DIR / "release_notes.j2")
+    finally:
+        release_notes._load_release_notes_template.cache_clear()
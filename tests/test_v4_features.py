@@ -28,7 +28,7 @@ sys.path.insert(0, str(project_root))
 
 from src.utils.logging import get_logger
 from src.config.config import load_config, Settings
-from src.llm.wmt_gateway_adapter import call_llm
+from src.llm.wmt_gateway_adapter import call_llm, reload_llm_config
 
 
 def test_version_validation():
@@ -241,6 +241,8 @@ def test_llm_timeout_handling():
             "WMT_LLM_API_URL": "http://non-existent-server.com:8000",
             "WMT_LLM_API_KEY": "test-key"
         }, clear=False):
+            # Pick up the patched gateway settings
+            reload_llm_config()
             
             start_time = time.time()
             try:
@@ -271,6 +273,68 @@ def test_llm_timeout_handling():
     except Exception as e:
         logger.error(f"❌ LLM timeout test failed: {e}")
         return False
+    finally:
+        # Don't leak the patched gateway settings into later tests
+        reload_llm_config()
+
+
+def test_llm_auth_failure_disables_gateway():
+    """Test that a 401/403 from the LLM Gateway short-circuits later calls."""
+    logger = get_logger(__name__)
+    logger.info("🔒 Testing LLM Gateway auth failure handling...")
+    
+    import requests
+    
+    unauthorized = MagicMock()
+    unauthorized.status_code = 401
+    unauthorized.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "401 Unauthorized", response=unauthorized
+    )
+    
+    try:
+        with patch.dict(os.environ, {
+            "WMT_LLM_API_URL": "http://llm-gateway.example.com",
+            "WMT_LLM_API_KEY": "bad-key"
+        }, clear=False):
+            reload_llm_config()
+            
+            with patch("src.llm.wmt_gateway_adapter.requests.post", return_value=unauthorized) as mock_post:
+                assert call_llm("first prompt") is None
+                assert call_llm("second prompt") is None
+                # The second call must not reach the network
+                assert mock_post.call_count == 1, f"Expected 1 request, got {mock_post.call_count}"
+        
+        logger.info("✅ LLM Gateway disabled after auth failure")
+        return True
+    finally:
+        reload_llm_config()
+
+
+def test_llm_transient_error_keeps_gateway():
+    """Test that transient request errors don't disable the LLM Gateway."""
+    logger = get_logger(__name__)
+    logger.info("🔁 Testing LLM Gateway transient error handling...")
+    
+    import requests
+    
+    try:
+        with patch.dict(os.environ, {
+            "WMT_LLM_API_URL": "http://llm-gateway.example.com",
+            "WMT_LLM_API_KEY": "test-key"
+        }, clear=False):
+            reload_llm_config()
+            
+            with patch("src.llm.wmt_gateway_adapter.requests.post",
+                       side_effect=requests.exceptions.ChunkedEncodingError("connection broken")) as mock_post:
+                assert call_llm("first prompt") is None
+                assert call_llm("second prompt") is None
+                # Both calls must still reach the network
+                assert mock_post.call_count == 2, f"Expected 2 requests, got {mock_post.call_count}"
+        
+        logger.info("✅ LLM Gateway stays enabled after a transient error")
+        return True
+    finally:
+        reload_llm_config()
 
 
 def test_service_name_extraction():
@@ -378,6 +442,8 @@ def run_all_v4_tests():
         ("Release Type Prompts", test_release_type_prompts),
         ("Environment Configuration", test_environment_configuration),
         ("LLM Timeout Handling", test_llm_timeout_handling),
+        ("LLM Auth Failure Handling", test_llm_auth_failure_disables_gateway),
+        ("LLM Transient Error Handling", test_llm_transient_error_keeps_gateway),
         ("Service Name Extraction", test_service_name_extraction),
         ("Config Validation", test_config_validation),
     ]